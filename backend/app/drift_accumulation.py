@@ -166,13 +166,13 @@ def calculate_drift_velocity(
 
     # Get recent turn IDs
     recent_turns = graph.turns[-window:] if len(graph.turns) >= window else graph.turns
-    recent_turn_ids = [t.id for t in recent_turns]
+    recent_turn_ids = {t.id for t in recent_turns}
 
-    # Sum drift magnitude in recent window
+    # Sum drift magnitude in recent window (indexed lookup, in event order)
+    drift_events = graph.drift_events
     recent_drift = sum(
-        event.drift_magnitude
-        for event in graph.drift_events
-        if event.detected_at_turn in recent_turn_ids
+        drift_events[position].drift_magnitude
+        for position in graph.drift_event_positions(recent_turn_ids)
     )
 
     # Calculate velocity
@@ -227,21 +227,16 @@ def detect_drift_recovery(
     if len(graph.turns) < lookback_window:
         return False
 
+    # Recovery needs a low score; check it first since it is O(1)
+    if graph.epistemic_drift_score >= 1.0:
+        return False
+
     # Get recent turn IDs
     recent_turns = graph.turns[-lookback_window:]
-    recent_turn_ids = [t.id for t in recent_turns]
-
-    # Check for new drift events in recent window
-    recent_drift_events = [
-        event for event in graph.drift_events
-        if event.detected_at_turn in recent_turn_ids
-    ]
-
-    # Recovery = no recent drift AND score is low
-    is_recovering = (
-        len(recent_drift_events) == 0 and
-        graph.epistemic_drift_score < 1.0
-    )
+    recent_turn_ids = {t.id for t in recent_turns}
+
+    # Recovery = no drift event in the recent window
+    is_recovering = not graph.drift_event_positions(recent_turn_ids)
 
     return is_recovering
 
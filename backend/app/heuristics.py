@@ -9,6 +9,7 @@ These cheap, deterministic rules detect common patterns without API calls:
 """
 
 import re
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Tuple, Optional
 from app.models import (
@@ -19,7 +20,7 @@ from app.models import (
     Edge,
     HeuristicScore
 )
-from app.structural_analysis import infer_polarity_structural
+from app.structural_analysis import infer_polarity_structural, infer_polarity_structural_batch
 from app.drift_accumulation import accumulate_drift
 
 
@@ -97,21 +98,28 @@ def extract_commitments_simple(turn: Turn, graph: CommitmentGraph) -> List[Commi
         (r"(?:Assuming|Given that|If) (.+)", "assumption"),
     ]
 
+    matched = []
     for pattern, kind in claim_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            normalized_text = match.strip()
-            commitment = Commitment(
-                id=f"c{len(graph.commitments) + len(commitments) + 1}",
-                turn_id=turn.id,
-                kind=kind,
-                normalized=normalized_text,
-                polarity=_infer_polarity(match),
-                confidence=_infer_confidence(text),
-                topic_anchor=extract_topic_anchor(normalized_text),  # Extract topic anchor
-                timestamp=turn.ts
-            )
-            commitments.append(commitment)
+        for match in re.findall(pattern, text, re.IGNORECASE):
+            matched.append((kind, match))
+
+    # Polarity for all matches in one batch; confidence depends only on the turn
+    polarities = infer_polarity_structural_batch([match for _, match in matched])
+    confidence = _infer_confidence(text)
+
+    for (kind, match), polarity in zip(matched, polarities):
+        normalized_text = match.strip()
+        commitment = Commitment(
+            id=f"c{len(graph.commitments) + len(commitments) + 1}",
+            turn_id=turn.id,
+            kind=kind,
+            normalized=normalized_text,
+            polarity=polarity,
+            confidence=confidence,
+            topic_anchor=extract_topic_anchor(normalized_text),  # Extract topic anchor
+            timestamp=turn.ts
+        )
+        commitments.append(commitment)
 
     # If no patterns matched, create a generic claim
     if not commitments and len(text) > 20:
@@ -130,6 +138,12 @@ def extract_commitments_simple(turn: Turn, graph: CommitmentGraph) -> List[Commi
     return commitments
 
 
+# Explicit contradiction markers, matched as substrings of the turn text
+_CONTRADICTION_MARKER_PATTERN = re.compile(
+    "actually|but|however|instead|rather|on the other hand"
+)
+
+
 def detect_polarity_flip(graph: CommitmentGraph, commitment: Commitment) -> Tuple[Alert | None, Edge | None]:
     """
     Detect if a commitment contradicts a prior commitment.
@@ -158,22 +172,25 @@ def detect_polarity_flip(graph: CommitmentGraph, commitment: Commitment) -> Tupl
         return None
 
     # Check for explicit contradiction markers in ORIGINAL turn text
-    contradiction_markers = ["actually", "but", "however", "instead", "rather", "on the other hand"]
-    has_marker = any(m in current_turn.text.lower() for m in contradiction_markers)
+    has_marker = _CONTRADICTION_MARKER_PATTERN.search(current_turn.text.lower()) is not None
 
-    # Get last N active commitments (longitudinal window)
-    active_prior_commitments = [
-        c for c in graph.commitments
-        if c.turn_id < commitment.turn_id and c.active
-    ]
-    # Sort by turn_id descending, take last 10 (expanded window for topic matching)
-    active_prior_commitments.sort(key=lambda c: c.turn_id, reverse=True)
-    recent_priors = active_prior_commitments[:10]
+    # Without a marker only a true positive <-> negative flip counts, which a
+    # neutral commitment can never be part of: skip the prior scan entirely
+    if not has_marker and commitment.polarity == "neutral":
+        return None, None
+
+    # Get last N active commitments (longitudinal window): the 10 latest by
+    # turn_id, newest first (expanded window for topic matching)
+    recent_priors = graph.recent_active_commitments(commitment.turn_id, 10)
 
     best_match = None
     best_severity_score = 0.0
 
     for prior in recent_priors:
+        # CHEAPEST GATE: every contradiction below needs a polarity change
+        if prior.polarity == commitment.polarity:
+            continue
+
         # PRIMARY GATE: Topic anchor must match
         if not prior.topic_anchor:
             continue  # Skip commitments without topic anchor
@@ -186,33 +203,19 @@ def detect_polarity_flip(graph: CommitmentGraph, commitment: Commitment) -> Tupl
         if not anchor_match:
             continue  # Skip - different topics
 
-        # SECONDARY CONDITION: Check for polarity difference
-        is_contradiction = False
-        confidence_delta = abs(commitment.confidence - prior.confidence)
-
-        # TRUE opposites (positive ↔ negative) — always a contradiction
+        # SECONDARY CONDITION: polarities differ (checked above), so this is a
+        # contradiction if they are TRUE opposites (positive <-> negative), or
+        # if the turn carries an explicit contradiction marker (any shift,
+        # e.g. "X works" (neutral) -> "actually X doesn't work" (negative))
         is_opposite_polarity = (
             (prior.polarity == "positive" and commitment.polarity == "negative") or
             (prior.polarity == "negative" and commitment.polarity == "positive")
         )
-
-        # WEAKER SIGNAL: explicit contradiction marker + neutral→non-neutral shift
-        # catches "X works" (neutral) → "actually X doesn't work" (negative, has_marker)
-        is_marked_shift = (
-            has_marker and
-            commitment.polarity != "neutral" and
-            prior.polarity != commitment.polarity
-        )
-
-        if is_opposite_polarity:
-            is_contradiction = True
-        elif is_marked_shift:
-            is_contradiction = True
-        elif has_marker and prior.polarity != commitment.polarity:
-            # Explicit contradiction marker + any polarity shift
-            is_contradiction = True
+        is_contradiction = is_opposite_polarity or has_marker
 
         if is_contradiction:
+            confidence_delta = abs(commitment.confidence - prior.confidence)
+
             # Compute similarity as optional bonus weight
             similarity = _text_similarity(prior.normalized, commitment.normalized)
 
@@ -428,18 +431,71 @@ def _text_similarity(text1: str, text2: str) -> float:
     Phase 1: Basic token intersection.
     Phase 2: Replace with sentence embeddings.
     """
-    tokens1 = set(text1.lower().split())
-    tokens2 = set(text2.lower().split())
+    tokens1 = _token_set(text1)
+    tokens2 = _token_set(text2)
 
     if not tokens1 or not tokens2:
         return 0.0
 
-    intersection = tokens1.intersection(tokens2)
-    union = tokens1.union(tokens2)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|; no need to build the union set
+    intersection_size = len(tokens1 & tokens2)
+    union_size = len(tokens1) + len(tokens2) - intersection_size
+
+    return intersection_size / union_size
+
+
+@lru_cache(maxsize=4096)
+def _token_set(text: str) -> frozenset:
+    """
+    Lowercased token set of a commitment text.
+
+    Cached: each prior commitment is compared against every new one, so
+    the same normalized text is tokenized over and over otherwise.
+    """
+    return frozenset(text.lower().split())
+
 
-    return len(intersection) / len(union) if union else 0.0
+# Topic anchor vocabulary, built once at import time
 
+# Common discourse markers to remove from start (checked in order)
+_ANCHOR_DISCOURSE_MARKERS = (
+    'actually', 'but', 'however', 'though', 'although', 'yet', 'still',
+    'instead', 'rather', 'on the other hand', 'in fact', 'meanwhile',
+)
 
+# Common copula verbs that signal subject-predicate structure
+_ANCHOR_COPULAS = frozenset({'is', 'are', 'was', 'were', 'be', 'being', 'been'})
+
+# Common stop words and pronouns to skip
+_ANCHOR_STOP_WORDS = frozenset({
+    'i', 'the', 'a', 'an', 'to', 'for', 'of', 'in', 'on', 'at', 'by', 'with',
+    'you', 'your', 'it', 'its', 'this', 'that', 'these', 'those',
+    'they', 'their', 'there', 'we', 'our', 'my', 'me', 'him', 'her', 'us',
+    'can', 'will', 'would', 'could', 'should', 'may', 'might', 'shall',
+})
+
+# Verbs whose object is the topic ("I prefer X")
+_ANCHOR_PREFERENCE_VERBS = frozenset({
+    'prefer', 'like', 'love', 'hate', 'avoid', 'use', 'need', 'want',
+})
+
+# Generic filler words that appear at the start of ChatGPT responses and
+# don't represent a topic
+_ANCHOR_FILLER_WORDS = frozenset({
+    'think', 'believe', 'seems', 'appears', 'actually', 'however',
+    # ChatGPT response starters
+    'let', 'here', 'sure', 'great', 'now', 'also', 'just', 'well',
+    'note', 'yes', 'okay', 'certainly', 'absolutely',
+    # Question words (don't make good topic anchors)
+    'how', 'what', 'when', 'where', 'why', 'which',
+    # Generic action verbs
+    'get', 'make', 'take', 'use', 'need', 'want', 'help', 'try',
+    'start', 'look', 'see', 'know', 'come', 'give', 'tell', 'show',
+})
+
+
+# Pure function of its input, so repeated texts are served from the cache
+@lru_cache(maxsize=1024)
 def extract_topic_anchor(text: str) -> Optional[str]:
     """
     Extract primary topic anchor from text using simple heuristics.
@@ -474,38 +530,23 @@ def extract_topic_anchor(text: str) -> Optional[str]:
     # Remove common punctuation at start/end
     text_lower = text_lower.strip('.,!?;:')
 
-    # Common discourse markers to remove from start
-    discourse_markers = ['actually', 'but', 'however', 'though', 'although', 'yet', 'still',
-                        'instead', 'rather', 'on the other hand', 'in fact', 'meanwhile']
-
     # Remove discourse markers from the beginning (handle with or without comma)
-    for marker in discourse_markers:
+    for marker in _ANCHOR_DISCOURSE_MARKERS:
         # Check for "marker " or "marker, "
         if text_lower.startswith(marker + ' ') or text_lower.startswith(marker + ','):
             text_lower = text_lower[len(marker):].strip()
             text_lower = text_lower.lstrip(',').strip()
             break
 
-    # Common copula verbs that signal subject-predicate structure
-    copulas = ['is', 'are', 'was', 'were', 'be', 'being', 'been']
-
-    # Common stop words and pronouns to skip
-    stop_words = {
-        'i', 'the', 'a', 'an', 'to', 'for', 'of', 'in', 'on', 'at', 'by', 'with',
-        'you', 'your', 'it', 'its', 'this', 'that', 'these', 'those',
-        'they', 'their', 'there', 'we', 'our', 'my', 'me', 'him', 'her', 'us',
-        'can', 'will', 'would', 'could', 'should', 'may', 'might', 'shall',
-    }
-
     tokens = text_lower.split()
     if not tokens:
         return None
 
     # Strategy 1: Look for copula verb and extract subject before it
     for i, token in enumerate(tokens):
-        if token in copulas and i > 0:
+        if token in _ANCHOR_COPULAS and i > 0:
             # Extract subject before copula (1-2 tokens)
-            if i >= 2 and tokens[i-2] not in stop_words:
+            if i >= 2 and tokens[i-2] not in _ANCHOR_STOP_WORDS:
                 # Multi-word anchor (e.g., "unit testing")
                 anchor = f"{tokens[i-2]} {tokens[i-1]}"
             else:
@@ -514,36 +555,23 @@ def extract_topic_anchor(text: str) -> Optional[str]:
 
             # Clean and validate
             anchor = anchor.strip('.,!?;:\'\"')
-            if anchor not in stop_words and len(anchor) > 2:
+            if anchor not in _ANCHOR_STOP_WORDS and len(anchor) > 2:
                 return anchor
 
     # Strategy 2: Look for common patterns like "I prefer X", "X helps", etc.
-    preference_verbs = ['prefer', 'like', 'love', 'hate', 'avoid', 'use', 'need', 'want']
     for i, token in enumerate(tokens):
-        if token in preference_verbs and i < len(tokens) - 1:
+        if token in _ANCHOR_PREFERENCE_VERBS and i < len(tokens) - 1:
             # Extract object after preference verb
             anchor = tokens[i+1].strip('.,!?;:\'\"')
-            if anchor not in stop_words and len(anchor) > 2:
+            if anchor not in _ANCHOR_STOP_WORDS and len(anchor) > 2:
                 return anchor
 
     # Strategy 3: Take first significant content word — skip generic filler words
-    # that appear at the start of ChatGPT responses and don't represent a topic
-    common_verbs = {
-        'think', 'believe', 'seems', 'appears', 'actually', 'however',
-        # ChatGPT response starters
-        'let', 'here', 'sure', 'great', 'now', 'also', 'just', 'well',
-        'note', 'yes', 'okay', 'certainly', 'absolutely',
-        # Question words (don't make good topic anchors)
-        'how', 'what', 'when', 'where', 'why', 'which',
-        # Generic action verbs
-        'get', 'make', 'take', 'use', 'need', 'want', 'help', 'try',
-        'start', 'look', 'see', 'know', 'come', 'give', 'tell', 'show',
-    }
     for token in tokens:
         cleaned = token.strip('.,!?;:\'\"')
         # Normalize contractions: "here's" → "here", "let's" → "let"
         cleaned = cleaned.split("'")[0]
-        if cleaned not in stop_words and cleaned not in common_verbs and len(cleaned) > 2:
+        if cleaned not in _ANCHOR_STOP_WORDS and cleaned not in _ANCHOR_FILLER_WORDS and len(cleaned) > 2:
             return cleaned
 
     return None
@@ -559,15 +587,22 @@ def _infer_polarity(text: str) -> str:
     return infer_polarity_structural(text)
 
 
+# Confidence markers, each list fused into one alternation so a text is
+# scanned once per list. Substring matches, like the original `in` checks.
+_STRONG_CONFIDENCE_PATTERN = re.compile(
+    "definitely|certainly|absolutely|clearly|obviously"
+)
+_HEDGE_PATTERN = re.compile(
+    "maybe|perhaps|possibly|might|could|seems|appears"
+)
+
+
 def _infer_confidence(text: str) -> float:
     """Infer confidence from hedging language."""
-    hedges = ["maybe", "perhaps", "possibly", "might", "could", "seems", "appears"]
-    strong = ["definitely", "certainly", "absolutely", "clearly", "obviously"]
-
     text_lower = text.lower()
 
-    if any(h in text_lower for h in strong):
+    if _STRONG_CONFIDENCE_PATTERN.search(text_lower):
         return 0.9
-    elif any(h in text_lower for h in hedges):
+    elif _HEDGE_PATTERN.search(text_lower):
         return 0.5
     return 0.7  # default moderate confidence
\ No newline at end of file
@@ -29,6 +29,59 @@ class K2Client:
         if not self.api_key:
             logger.warning("K2_API_KEY not set - K2 features will be disabled")
 
+        # Shared HTTP client, created lazily on the event loop that uses it
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _http_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client used for every K2 request.
+
+        An httpx.AsyncClient is bound to the event loop it first runs on,
+        so a fresh client is created if the running loop has changed
+        (e.g. successive asyncio.run() calls in scripts) or it was closed.
+        The client left behind on the old loop is closed first.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            await self._close_stale_client()
+        if self._client is None or self._client.is_closed:
+            # Configure timeout for all operations (connect, read, write, pool)
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(K2_TIMEOUT, read=K2_TIMEOUT),
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0)
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def _close_stale_client(self) -> None:
+        """Close the client created on another event loop."""
+        client, client_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client.is_closed:
+            return
+
+        if client_loop is not None and client_loop.is_running():
+            # Loop still running in another thread: close the client there
+            future = asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+            await asyncio.wrap_future(future)
+            return
+
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Pooled connections belong to a loop that has already closed and
+            # cannot be shut down from here; their sockets are freed with them
+            logger.debug(f"[K2] Stale HTTP client closed with pending connections: {e}")
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
     async def extract_structured_commitments(self, turn_text: str) -> Optional[List[Dict]]:
         """
         Phase 3: Extract structured claims using K2 API.
@@ -74,84 +127,83 @@ Turn:
         try:
             self.call_count += 1
 
-            # Configure timeout for all operations (connect, read, write, pool)
-            timeout_config = httpx.Timeout(K2_TIMEOUT, read=K2_TIMEOUT)
-            async with httpx.AsyncClient(timeout=timeout_config) as client:
-                response = await client.post(
-                    f"{K2_API_BASE}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": K2_MODEL,
-                        "messages": [
-                            {"role": "user", "content": prompt}
-                        ],
-                        "stream": False
-                    }
-                )
-
-                logger.info(f"[Continuum DEBUG] HTTP status: {response.status_code}")
-
-                response.raise_for_status()
-
-                # Log raw response for debugging
-                response_text = response.text
-                logger.info(f"[Continuum DEBUG] Raw HTTP response length: {len(response_text)}")
-                logger.info(f"[Continuum DEBUG] Raw HTTP response: {response_text[:1000]}")
-
-                if not response_text:
-                    logger.error("[Continuum DEBUG] Response is empty!")
-                    return None
-
-                result = response.json()
-                logger.info(f"[Continuum DEBUG] Parsed JSON keys: {result.keys()}")
-
-                # Parse response
-                content = result["choices"][0]["message"]["content"]
-
-                logger.info(f"[Continuum DEBUG] Message content length: {len(content)}")
-                logger.info(f"[Continuum DEBUG] Content preview: {content[:300]}...")
-                logger.info(f"[Continuum DEBUG] Content end: ...{content[-500:]}")
-
-                # K2 Think models include reasoning before the answer
-                # The JSON usually appears after </think> tag or at the end
-                json_content = None
-
-                # Try to find JSON in markdown code blocks first
-                if "```json" in content:
-                    json_content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    json_content = content.split("```")[1].split("```")[0].strip()
-                elif "</think>" in content:
-                    # Extract everything after </think> tag
-                    json_content = content.split("</think>")[-1].strip()
+            # Pooled client: keeps the connection to the K2 API warm across calls
+            client = await self._http_client()
+            response = await client.post(
+                f"{K2_API_BASE}/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": K2_MODEL,
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "stream": False
+                }
+            )
+
+            logger.info(f"[Continuum DEBUG] HTTP status: {response.status_code}")
+
+            response.raise_for_status()
+
+            # Log raw response for debugging
+            response_text = response.text
+            logger.info(f"[Continuum DEBUG] Raw HTTP response length: {len(response_text)}")
+            logger.info(f"[Continuum DEBUG] Raw HTTP response: {response_text[:1000]}")
+
+            if not response_text:
+                logger.error("[Continuum DEBUG] Response is empty!")
+                return None
+
+            result = response.json()
+            logger.info(f"[Continuum DEBUG] Parsed JSON keys: {result.keys()}")
+
+            # Parse response
+            content = result["choices"][0]["message"]["content"]
+
+            logger.info(f"[Continuum DEBUG] Message content length: {len(content)}")
+            logger.info(f"[Continuum DEBUG] Content preview: {content[:300]}...")
+            logger.info(f"[Continuum DEBUG] Content end: ...{content[-500:]}")
+
+            # K2 Think models include reasoning before the answer
+            # The JSON usually appears after </think> tag or at the end
+            json_content = None
+
+            # Try to find JSON in markdown code blocks first
+            if "```json" in content:
+                json_content = content.split("```json")[1].split("```")[0].strip()
+            elif "```" in content:
+                json_content = content.split("```")[1].split("```")[0].strip()
+            elif "</think>" in content:
+                # Extract everything after </think> tag
+                json_content = content.split("</think>")[-1].strip()
+            else:
+                # Find the last occurrence of {"claims":
+                import re
+                # Find all JSON-like structures starting with {
+                last_brace = content.rfind('{"claims"')
+                if last_brace != -1:
+                    # Extract from that point to the end
+                    potential_json = content[last_brace:]
+                    # Try to find the closing brace
+                    json_content = potential_json
                 else:
-                    # Find the last occurrence of {"claims":
-                    import re
-                    # Find all JSON-like structures starting with {
-                    last_brace = content.rfind('{"claims"')
-                    if last_brace != -1:
-                        # Extract from that point to the end
-                        potential_json = content[last_brace:]
-                        # Try to find the closing brace
-                        json_content = potential_json
-                    else:
-                        # Last resort: try the entire content
-                        json_content = content
-
-                if not json_content:
-                    logger.error(f"[Continuum DEBUG] Could not find JSON in response")
-                    return None
-
-                logger.info(f"[Continuum DEBUG] Extracted JSON: {json_content[:500]}...")
-
-                parsed = json.loads(json_content)
-                claims = parsed.get("claims", [])
-
-                logger.info(f"[Continuum DEBUG] K2 successfully extracted {len(claims)} claims")
-                return claims
+                    # Last resort: try the entire content
+                    json_content = content
+
+            if not json_content:
+                logger.error(f"[Continuum DEBUG] Could not find JSON in response")
+                return None
+
+            logger.info(f"[Continuum DEBUG] Extracted JSON: {json_content[:500]}...")
+
+            parsed = json.loads(json_content)
+            claims = parsed.get("claims", [])
+
+            logger.info(f"[Continuum DEBUG] K2 successfully extracted {len(claims)} claims")
+            return claims
 
         except asyncio.TimeoutError as e:
             logger.warning(f"K2 API timeout after {K2_TIMEOUT}s: {e}")
@@ -221,40 +273,39 @@ Return ONLY valid JSON:
         try:
             self.call_count += 1
 
-            # Configure timeout for all operations (connect, read, write, pool)
-            timeout_config = httpx.Timeout(K2_TIMEOUT, read=K2_TIMEOUT)
-            async with httpx.AsyncClient(timeout=timeout_config) as client:
-                response = await client.post(
-                    f"{K2_API_BASE}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": K2_MODEL,
-                        "messages": [
-                            {"role": "user", "content": prompt}
-                        ],
-                        "stream": False
-                    }
-                )
-
-                response.raise_for_status()
-                result = response.json()
-
-                # Parse response
-                content = result["choices"][0]["message"]["content"]
-
-                # Extract JSON
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                verification = json.loads(content)
-
-                logger.info(f"K2 verification: is_contradiction={verification.get('is_contradiction')}")
-                return verification
+            # Pooled client: keeps the connection to the K2 API warm across calls
+            client = await self._http_client()
+            response = await client.post(
+                f"{K2_API_BASE}/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": K2_MODEL,
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "stream": False
+                }
+            )
+
+            response.raise_for_status()
+            result = response.json()
+
+            # Parse response
+            content = result["choices"][0]["message"]["content"]
+
+            # Extract JSON
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0].strip()
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0].strip()
+
+            verification = json.loads(content)
+
+            logger.info(f"K2 verification: is_contradiction={verification.get('is_contradiction')}")
+            return verification
 
         except asyncio.TimeoutError:
             logger.warning(f"K2 verification timeout after {K2_TIMEOUT}s")
@@ -314,40 +365,39 @@ Return ONLY valid JSON:
         try:
             self.call_count += 1
 
-            # Configure timeout for all operations (connect, read, write, pool)
-            timeout_config = httpx.Timeout(K2_TIMEOUT, read=K2_TIMEOUT)
-            async with httpx.AsyncClient(timeout=timeout_config) as client:
-                response = await client.post(
-                    f"{K2_API_BASE}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": K2_MODEL,
-                        "messages": [
-                            {"role": "user", "content": prompt}
-                        ],
-                        "stream": False
-                    }
-                )
-
-                response.raise_for_status()
-                result = response.json()
-
-                # Parse response
-                content = result["choices"][0]["message"]["content"]
-
-                # Extract JSON
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-
-                reconciliation = json.loads(content)
-
-                logger.info(f"K2 generated reconciliation with confidence={reconciliation.get('confidence')}")
-                return reconciliation
+            # Pooled client: keeps the connection to the K2 API warm across calls
+            client = await self._http_client()
+            response = await client.post(
+                f"{K2_API_BASE}/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": K2_MODEL,
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "stream": False
+                }
+            )
+
+            response.raise_for_status()
+            result = response.json()
+
+            # Parse response
+            content = result["choices"][0]["message"]["content"]
+
+            # Extract JSON
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0].strip()
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0].strip()
+
+            reconciliation = json.loads(content)
+
+            logger.info(f"K2 generated reconciliation with confidence={reconciliation.get('confidence')}")
+            return reconciliation
 
         except asyncio.TimeoutError:
             logger.warning(f"K2 reconciliation timeout after {K2_TIMEOUT}s")
@@ -5,12 +5,18 @@ Provides endpoints for analyzing conversation turns and generating
 reconciliation suggestions.
 """
 
+import asyncio
+import hashlib
+import json
 import os
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 import logging
 
 # Load environment variables from .env file
@@ -19,9 +25,13 @@ load_dotenv()
 from app.models import (
     AnalyzeTurnRequest,
     AnalyzeTurnResponse,
+    AnalyzeTurnsBatchRequest,
+    AnalyzeTurnsBatchResponse,
+    TurnAnalysisResult,
     ReconcileRequest,
     ReconcileResponse,
     CommitmentGraph,
+    Turn,
     Alert,
     Commitment,
     Edge,
@@ -33,19 +43,29 @@ from app.analyzer import (
     analyze_turn_k2_first,  # Legacy
     analyze_turn_hybrid_escalation,  # Phase 3 Hybrid
     generate_k2_reconciliation,
-    process_k2_escalation_async
+    process_k2_escalation_async,
+    k2_client
 )
-from app.drift_accumulation import calculate_drift_velocity, apply_drift_decay
+from app.drift_accumulation import calculate_drift_velocity, apply_drift_decay, get_drift_summary
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the pooled K2 HTTP client on shutdown."""
+    yield
+    await k2_client.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Continuum API",
     description="Epistemic drift detection for LLM conversations",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS middleware (allow extension to call backend)
@@ -57,8 +77,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory session store (replace with Redis/SQLite in production)
-conversation_graphs: Dict[str, CommitmentGraph] = {}
+# In-memory session store (replace with Redis/SQLite in production).
+# Bounded: once full, the least recently used conversation is evicted.
+MAX_CONVERSATIONS = 10_000
+conversation_graphs: "OrderedDict[str, CommitmentGraph]" = OrderedDict()
+evicted_conversations = 0
+
+# Live drift subscribers per conversation (SSE /conversations/{id}/events)
+drift_subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+# Seconds between SSE keep-alive comments on an idle stream
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Pending events per SSE subscriber; a slow reader loses the oldest first
+SSE_QUEUE_MAXSIZE = 64
 
 # Check K2 API key on startup
 K2_API_KEY = os.getenv("K2_API_KEY")
@@ -78,7 +110,9 @@ async def root():
     return {
         "status": "ok",
         "service": "Continuum API",
-        "version": "0.1.0"
+        "version": "0.1.0",
+        "conversations": len(conversation_graphs),
+        "evicted_conversations": evicted_conversations
     }
 
 
@@ -110,105 +144,88 @@ async def analyze_turn(request: AnalyzeTurnRequest, background_tasks: Background
             current_hash = graph.compute_hash()
             if current_hash == request.last_graph_hash:
                 logger.info("Cache hit - no changes since last analysis")
-                return AnalyzeTurnResponse(
+                response = AnalyzeTurnResponse(
                     updated_graph=graph,
                     alerts=[],
                     cache_hit=True
                 )
+                return Response(content=response.model_dump_json(), media_type="application/json")
     else:
-        graph = CommitmentGraph(
-            conversation_id=request.conversation_id,
-            metadata={"created_at": datetime.now().isoformat()}
-        )
-
-    # Increment version for race condition handling
-    graph.version += 1
-
-    # Add new turn to graph
-    graph.turns.append(request.new_turn)
-
-    # Phase 3 Hybrid: Run heuristics-first with intelligent escalation
-    new_alerts, new_commitments, new_edges, analysis_metadata = await analyze_turn_hybrid_escalation(
-        graph=graph,
-        new_turn=request.new_turn
-    )
-
-    # Update graph with new commitments and edges
-    graph.commitments.extend(new_commitments)
-    graph.edges.extend(new_edges)
-    graph.alerts.extend(new_alerts)
-
-    # Update drift velocity on the graph object
-    graph.drift_velocity = calculate_drift_velocity(graph)
+        graph = _new_graph(request.conversation_id)
 
-    # If no drift events were added this turn, increment stability counter and apply decay
-    turn_had_drift = any(e.detected_at_turn == request.new_turn.id for e in graph.drift_events)
-    if not turn_had_drift:
-        graph.turns_since_last_drift += 1
-        apply_drift_decay(graph)
+    response, pending_k2 = await _analyze_turn_into_graph(graph, request.new_turn)
 
-    # Store metadata for this conversation
-    if "analysis_history" not in graph.metadata:
-        graph.metadata["analysis_history"] = []
-    graph.metadata["analysis_history"].append({
-        "turn_id": request.new_turn.id,
-        "engine_used": analysis_metadata["engine_used"],
-        "k2_calls": analysis_metadata["k2_calls"],
-        "escalation_triggered": analysis_metadata.get("escalation_triggered", False),
-        "escalation_reason": analysis_metadata.get("escalation_reason")
-    })
-
-    # Handle async K2 processing
-    if analysis_metadata.get("engine_used") == "heuristic_with_pending_k2":
+    if pending_k2 is not None:
         # Trigger background K2 processing
+        alerts, commitments = pending_k2
         background_tasks.add_task(
             process_k2_escalation_async,
             graph=graph,
-            alerts=new_alerts,
-            commitments=new_commitments,
+            alerts=alerts,
+            commitments=commitments,
             version=graph.version
         )
 
-        # Mark as pending in metadata
-        graph.metadata["k2_processing_pending"] = True
-        graph.metadata["k2_processing_version"] = graph.version
+    # Serialize directly; returning the model would make FastAPI validate
+    # the full graph again against response_model before encoding it
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
-    # Generate reconciliation if needed
-    suggested_message = None
-    if new_alerts:
-        highest_severity = max(new_alerts, key=lambda a:
-            {"low": 1, "medium": 2, "high": 3, "critical": 4}[a.severity]
-        )
 
-        if analysis_metadata.get("engine_used") == "k2_immediate":
-            # K2 already ran - try reconciliation
-            suggested_message, _ = await generate_k2_reconciliation(graph, highest_severity)
-        else:
-            # Heuristic or pending K2 - use template
-            suggested_message = _generate_suggestion(graph, highest_severity)
+@app.post("/analyze-turns-batch", response_model=AnalyzeTurnsBatchResponse)
+async def analyze_turns_batch(request: AnalyzeTurnsBatchRequest, background_tasks: BackgroundTasks):
+    """
+    Analyze several consecutive turns of one conversation in a single request.
 
-    # Save to cache
-    conversation_graphs[request.conversation_id] = graph
+    Turns are analyzed in order as if each had been posted to /analyze-turn,
+    but the graph is serialized once at the end instead of once per turn.
+    Async K2 verification for every escalated turn is queued as one
+    background task against the final graph version, so it runs after the
+    whole batch rather than between turns.
 
-    # Build cost estimate
-    cost_estimate = {
-        "k2_calls": analysis_metadata["k2_calls"],
-        "tokens_used": 0,  # TODO: track actual tokens
-        "engine_used": analysis_metadata["engine_used"],
-        "escalation_triggered": analysis_metadata.get("escalation_triggered", False),
-        "k2_verification_used": analysis_metadata.get("k2_verification_used", False),
-        "k2_overrides": analysis_metadata.get("k2_overrides", 0),
-        "pending_k2": analysis_metadata.get("engine_used") == "heuristic_with_pending_k2"
-    }
+    Args:
+        request: Contains conversation_id and the ordered turns to analyze
+        background_tasks: FastAPI background tasks for async K2 processing
 
-    return AnalyzeTurnResponse(
-        updated_graph=graph,
-        alerts=new_alerts,
-        suggested_message=suggested_message,
-        cost_estimate=cost_estimate,
-        cache_hit=False
+    Returns:
+        AnalyzeTurnsBatchResponse with the final graph and per-turn results
+    """
+    logger.info(
+        f"[Hybrid] Analyzing {len(request.turns)} turns for conversation {request.conversation_id}"
     )
 
+    graph = conversation_graphs.get(request.conversation_id) or _new_graph(request.conversation_id)
+
+    results = []
+    pending_k2 = False
+    pending_alerts: List[Alert] = []
+    pending_commitments: List[Commitment] = []
+    for new_turn in request.turns:
+        turn_response, turn_pending_k2 = await _analyze_turn_into_graph(graph, new_turn)
+        if turn_pending_k2 is not None:
+            pending_k2 = True
+            pending_alerts.extend(turn_pending_k2[0])
+            pending_commitments.extend(turn_pending_k2[1])
+        results.append(TurnAnalysisResult(
+            turn_id=new_turn.id,
+            alerts=turn_response.alerts,
+            suggested_message=turn_response.suggested_message,
+            cost_estimate=turn_response.cost_estimate
+        ))
+
+    if pending_k2:
+        # One task for the whole batch; per-turn versions would all be stale
+        # by the time background tasks run
+        background_tasks.add_task(
+            process_k2_escalation_async,
+            graph=graph,
+            alerts=pending_alerts,
+            commitments=pending_commitments,
+            version=graph.version
+        )
+
+    response = AnalyzeTurnsBatchResponse(updated_graph=graph, results=results)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
 
 @app.get("/conversations/{conversation_id}/k2-status")
 async def get_k2_status(conversation_id: str):
@@ -226,7 +243,7 @@ async def get_k2_status(conversation_id: str):
     Returns:
         K2 status response matching extension expectations
     """
-    graph = conversation_graphs.get(conversation_id)
+    graph = _get_graph(conversation_id)
     if not graph:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -354,11 +371,10 @@ async def reconcile(request: ReconcileRequest):
     logger.info(f"Reconciling alert {request.alert_id} for {request.conversation_id}")
 
     # Retrieve graph
-    if request.conversation_id not in conversation_graphs:
+    graph = _get_graph(request.conversation_id)
+    if graph is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    graph = conversation_graphs[request.conversation_id]
-
     # Find the alert
     alert = next((a for a in graph.alerts if a.id == request.alert_id), None)
     if not alert:
@@ -369,25 +385,32 @@ async def reconcile(request: ReconcileRequest):
 
     # TODO Phase 2: Call K2 API if mode == "auto" and user_api_key provided
 
-    return ReconcileResponse(
+    response = ReconcileResponse(
         reconciliation_response=reconciliation_text,
         updated_graph=graph,
         resolved=False,  # Will be true when user confirms
         cost_estimate={"k2_calls": 0}
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @app.get("/conversations/{conversation_id}")
 async def get_conversation(conversation_id: str):
-    """Retrieve full conversation graph for debugging/export."""
-    if conversation_id not in conversation_graphs:
+    """
+    Retrieve full conversation graph for debugging/export.
+
+    The graph is serialized straight to JSON bytes by pydantic-core rather
+    than being walked into an intermediate dict by jsonable_encoder.
+    """
+    graph = _get_graph(conversation_id)
+    if graph is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return conversation_graphs[conversation_id]
+    return Response(content=graph.model_dump_json(), media_type="application/json")
 
 
 @app.get("/conversations/{conversation_id}/metrics")
-async def get_conversation_metrics(conversation_id: str):
+async def get_conversation_metrics(conversation_id: str, request: Request, fields: Optional[str] = None):
     """
     Retrieve epistemic health metrics for a conversation.
 
@@ -399,10 +422,18 @@ async def get_conversation_metrics(conversation_id: str):
     - Overall health score (0-100)
 
     Returns empty/zero metrics for conversations not yet analyzed (new chats).
+
+    Pass fields as comma-separated dotted paths (e.g.
+    ?fields=drift.cumulative_drift_score,contradictions.count) to receive
+    only those values.
+
+    The response carries an ETag of its body. Pollers that send it back in
+    If-None-Match get an empty 304 while the metrics are unchanged.
     """
-    if conversation_id not in conversation_graphs:
+    graph = _get_graph(conversation_id)
+    if graph is None:
         # New conversation not yet seen — return zeroes so extension shows a clean state
-        return {
+        metrics = {
             "drift": {
                 "cumulative_drift_score": 0,
                 "drift_velocity": 0,
@@ -413,11 +444,60 @@ async def get_conversation_metrics(conversation_id: str):
             "escalation": {"total_escalations": 0},
             "health_score": 100
         }
+    else:
+        metrics = compute_epistemic_metrics(graph)
+
+    if fields:
+        metrics = _select_fields(metrics, fields)
 
-    graph = conversation_graphs[conversation_id]
-    metrics = compute_epistemic_metrics(graph)
+    # Same compact encoding FastAPI's JSONResponse would produce
+    body = json.dumps(
+        metrics, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
 
-    return metrics
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/conversations/{conversation_id}/events")
+async def stream_conversation_events(conversation_id: str, request: Request):
+    """
+    Stream drift summaries as Server-Sent Events.
+
+    Sends the current summary (if the conversation exists), then one event
+    per analyzed turn, so clients can replace metrics polling with a single
+    long-lived subscription. The stream ends when the conversation is deleted.
+    """
+    async def event_stream():
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_MAXSIZE)
+        try:
+            drift_subscribers.setdefault(conversation_id, []).append(queue)
+
+            graph = _get_graph(conversation_id)
+            if graph is not None:
+                summary = get_drift_summary(graph)
+                yield f"data: {json.dumps(summary)}\n\n"
+
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if payload is None:
+                    break
+                yield f"data: {payload}\n\n"
+        finally:
+            queues = drift_subscribers.get(conversation_id, [])
+            if queue in queues:
+                queues.remove(queue)
+            if not queues:
+                drift_subscribers.pop(conversation_id, None)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @app.delete("/conversations/{conversation_id}")
@@ -429,6 +509,9 @@ async def delete_conversation(conversation_id: str):
     """
     if conversation_id in conversation_graphs:
         del conversation_graphs[conversation_id]
+        # None tells each open event stream to finish
+        for queue in drift_subscribers.get(conversation_id, []):
+            _put_dropping_oldest(queue, None)
         logger.info(f"[Delete] Conversation {conversation_id} deleted - K2 state will reset on next population")
         return {"status": "deleted", "conversation_id": conversation_id}
     raise HTTPException(status_code=404, detail="Conversation not found")
@@ -442,10 +525,10 @@ async def reset_k2_timer(conversation_id: str):
     Clears k2_poll_start_time and k2_processing_complete to allow
     animation to play fresh when extension is opened.
     """
-    if conversation_id not in conversation_graphs:
+    graph = _get_graph(conversation_id)
+    if graph is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    graph = conversation_graphs[conversation_id]
     graph.metadata.pop("k2_poll_start_time", None)
     graph.metadata.pop("k2_processing_complete", None)
 
@@ -459,6 +542,192 @@ async def reset_k2_timer(conversation_id: str):
 
 # Helper functions
 
+def _new_graph(conversation_id: str) -> CommitmentGraph:
+    """Create an empty graph for a conversation seen for the first time."""
+    return CommitmentGraph(
+        conversation_id=conversation_id,
+        metadata={"created_at": datetime.now().isoformat()}
+    )
+
+
+def _get_graph(conversation_id: str) -> Optional[CommitmentGraph]:
+    """Look up a stored graph and mark it as the most recently used."""
+    graph = conversation_graphs.get(conversation_id)
+    if graph is not None:
+        conversation_graphs.move_to_end(conversation_id)
+    return graph
+
+
+def _store_graph(graph: CommitmentGraph) -> None:
+    """Save graph as the most recently used, evicting the oldest when full."""
+    global evicted_conversations
+
+    conversation_graphs[graph.conversation_id] = graph
+    conversation_graphs.move_to_end(graph.conversation_id)
+    while len(conversation_graphs) > MAX_CONVERSATIONS:
+        evicted_id, _ = conversation_graphs.popitem(last=False)
+        evicted_conversations += 1
+        logger.info(f"[Store] Evicted least recently used conversation {evicted_id}")
+
+
+async def _analyze_turn_into_graph(
+    graph: CommitmentGraph,
+    new_turn: Turn
+) -> Tuple[AnalyzeTurnResponse, Optional[Tuple[List[Alert], List[Commitment]]]]:
+    """
+    Run the hybrid analysis for one turn and fold the results into graph.
+
+    Shared by /analyze-turn and /analyze-turns-batch. Stores the graph in
+    the session store and notifies SSE subscribers.
+
+    Returns the response and, if the turn escalated to async K2, the
+    (alerts, commitments) to verify; the caller schedules that work.
+    """
+    # Increment version for race condition handling
+    graph.version += 1
+
+    # Add new turn to graph
+    graph.turns.append(new_turn)
+
+    # Phase 3 Hybrid: Run heuristics-first with intelligent escalation
+    new_alerts, new_commitments, new_edges, analysis_metadata = await analyze_turn_hybrid_escalation(
+        graph=graph,
+        new_turn=new_turn
+    )
+
+    # Update graph with new commitments and edges
+    graph.commitments.extend(new_commitments)
+    graph.edges.extend(new_edges)
+    graph.alerts.extend(new_alerts)
+
+    # Update drift velocity on the graph object
+    graph.drift_velocity = calculate_drift_velocity(graph)
+
+    # If no drift events were added this turn, increment stability counter and apply decay
+    turn_had_drift = bool(graph.drift_event_positions({new_turn.id}))
+    if not turn_had_drift:
+        graph.turns_since_last_drift += 1
+        apply_drift_decay(graph)
+
+    # Store metadata for this conversation
+    if "analysis_history" not in graph.metadata:
+        graph.metadata["analysis_history"] = []
+    graph.metadata["analysis_history"].append({
+        "turn_id": new_turn.id,
+        "engine_used": analysis_metadata["engine_used"],
+        "k2_calls": analysis_metadata["k2_calls"],
+        "escalation_triggered": analysis_metadata.get("escalation_triggered", False),
+        "escalation_reason": analysis_metadata.get("escalation_reason")
+    })
+
+    # Handle async K2 processing
+    pending_k2 = None
+    if analysis_metadata.get("engine_used") == "heuristic_with_pending_k2":
+        pending_k2 = (new_alerts, new_commitments)
+
+        # Mark as pending in metadata
+        graph.metadata["k2_processing_pending"] = True
+        graph.metadata["k2_processing_version"] = graph.version
+
+    # Generate reconciliation if needed
+    suggested_message = None
+    if new_alerts:
+        highest_severity = max(new_alerts, key=lambda a:
+            {"low": 1, "medium": 2, "high": 3, "critical": 4}[a.severity]
+        )
+
+        if analysis_metadata.get("engine_used") == "k2_immediate":
+            # K2 already ran - try reconciliation
+            suggested_message, _ = await generate_k2_reconciliation(graph, highest_severity)
+        else:
+            # Heuristic or pending K2 - use template
+            suggested_message = _generate_suggestion(graph, highest_severity)
+
+    # Save to cache
+    _store_graph(graph)
+    _publish_drift_update(graph)
+
+    # Build cost estimate
+    cost_estimate = {
+        "k2_calls": analysis_metadata["k2_calls"],
+        "tokens_used": 0,  # TODO: track actual tokens
+        "engine_used": analysis_metadata["engine_used"],
+        "escalation_triggered": analysis_metadata.get("escalation_triggered", False),
+        "k2_verification_used": analysis_metadata.get("k2_verification_used", False),
+        "k2_overrides": analysis_metadata.get("k2_overrides", 0),
+        "pending_k2": analysis_metadata.get("engine_used") == "heuristic_with_pending_k2"
+    }
+
+    response = AnalyzeTurnResponse(
+        updated_graph=graph,
+        alerts=new_alerts,
+        suggested_message=suggested_message,
+        cost_estimate=cost_estimate,
+        cache_hit=False
+    )
+    return response, pending_k2
+
+
+def _select_fields(data: dict, fields: str) -> dict:
+    """
+    Project data onto a comma-separated list of dotted paths.
+
+    "drift.cumulative_drift_score,contradictions.count" keeps only those
+    values, nested under their parent keys. Unknown paths are skipped.
+    """
+    selected = {}
+    for path in fields.split(","):
+        keys = path.strip().split(".")
+        value = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = selected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+    return selected
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag.
+
+    Accepts "*", a comma-separated list of tags, and weak W/"..." tags
+    (If-None-Match uses weak comparison).
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def _publish_drift_update(graph: CommitmentGraph) -> None:
+    """Push the graph's drift summary to any SSE subscribers."""
+    queues = drift_subscribers.get(graph.conversation_id)
+    if not queues:
+        return
+
+    payload = json.dumps(get_drift_summary(graph))
+    for queue in queues:
+        _put_dropping_oldest(queue, payload)
+
+
+def _put_dropping_oldest(queue: asyncio.Queue, item) -> None:
+    """Enqueue without blocking; a full queue first drops its oldest item."""
+    # Each summary supersedes the one before it, so the oldest is the stalest
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
 def _generate_suggestion(graph: CommitmentGraph, alert: Alert) -> str:
     """Generate a suggested reconciliation prompt based on alert type."""
     templates = {
@@ -5,6 +5,8 @@ This module provides functions for calculating health metrics
 about a conversation's epistemic state.
 """
 
+from collections import Counter
+from statistics import fmean
 from typing import Dict, Any
 from app.models import CommitmentGraph
 from app.drift_accumulation import get_drift_summary
@@ -28,34 +30,29 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
     Returns:
         Dictionary containing computed metrics
     """
-    active_commitments = graph.get_active_commitments()
-    inactive_commitments = [c for c in graph.commitments if not c.active]
-
-    # Basic commitment counts
+    # Commitment counts and stability scores in a single pass
     total_commitments = len(graph.commitments)
-    active_count = len(active_commitments)
-    inactive_count = len(inactive_commitments)
+    active_count = 0
+    stability_scores = []
+    for c in graph.commitments:
+        if c.active:
+            active_count += 1
+        stability_scores.append(c.stability_score)
+    inactive_count = total_commitments - active_count
 
     # Contradiction analysis
     contradiction_count = graph.count_contradictions()
-    contradiction_edges = [e for e in graph.edges if e.relation == "contradicts"]
 
     # Stability analysis
-    stability_scores = [c.stability_score for c in graph.commitments if c.stability_score is not None]
-    avg_stability = sum(stability_scores) / len(stability_scores) if stability_scores else 1.0
+    avg_stability = fmean(stability_scores) if stability_scores else 1.0
     min_stability = min(stability_scores) if stability_scores else 1.0
 
-    # Alert analysis
-    polarity_flip_alerts = [a for a in graph.alerts if a.alert_type == "polarity_flip"]
-    assumption_drop_alerts = [a for a in graph.alerts if a.alert_type == "assumption_drop"]
-    agreement_bias_alerts = [a for a in graph.alerts if a.alert_type == "agreement_bias"]
-    confidence_drift_alerts = [a for a in graph.alerts if a.alert_type == "confidence_drift"]
-
-    # Severity breakdown
-    critical_alerts = [a for a in graph.alerts if a.severity == "critical"]
-    high_alerts = [a for a in graph.alerts if a.severity == "high"]
-    medium_alerts = [a for a in graph.alerts if a.severity == "medium"]
-    low_alerts = [a for a in graph.alerts if a.severity == "low"]
+    # Alert analysis: tally type and severity in a single pass
+    alerts_by_type = Counter()
+    alerts_by_severity = Counter()
+    for a in graph.alerts:
+        alerts_by_type[a.alert_type] += 1
+        alerts_by_severity[a.severity] += 1
 
     # Compute epistemic health score (0-100)
     # Higher is better: penalize contradictions, inactive commitments, low stability
@@ -73,8 +70,8 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
         health_score -= inactive_rate * 15
 
         # Penalize critical/high severity alerts
-        health_score -= len(critical_alerts) * 10
-        health_score -= len(high_alerts) * 5
+        health_score -= alerts_by_severity["critical"] * 10
+        health_score -= alerts_by_severity["high"] * 5
 
     health_score = max(0, min(100, health_score))
 
@@ -99,7 +96,7 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
         urgency_distribution[urgency] += 1
 
     # Average stability at escalation
-    escalated_turn_ids = [e["turn_id"] for e in escalation_events]
+    escalated_turn_ids = {e["turn_id"] for e in escalation_events}
     escalated_commitments = [
         c for c in graph.commitments if c.turn_id in escalated_turn_ids
     ]
@@ -109,10 +106,8 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
     )
 
     # Phase 3 Hybrid: K2 authority metrics
-    k2_overrides_list = graph.k2_overrides if hasattr(graph, 'k2_overrides') else []
-    false_positives = [o for o in k2_overrides_list if o.override_type == "false_positive"]
-    upgrades = [o for o in k2_overrides_list if o.override_type == "severity_upgrade"]
-    downgrades = [o for o in k2_overrides_list if o.override_type == "severity_downgrade"]
+    k2_overrides_list = graph.k2_overrides
+    overrides_by_type = Counter(o.override_type for o in k2_overrides_list)
 
     # K2 precision estimate
     k2_precision = (
@@ -123,31 +118,23 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
     # Async processing metrics
     async_k2_calls = graph.metadata.get("async_k2_calls", 0)
     blocking_k2_calls = k2_calls_total - async_k2_calls
-    pending_k2_tasks = len([a for a in graph.alerts if a.metadata.get("pending_k2", False)])
+    pending_k2_tasks = sum(1 for a in graph.alerts if a.metadata.get("pending_k2", False))
 
     # Phase 4 (Drift Accumulator): Drift metrics
-    drift_summary = get_drift_summary(graph) if hasattr(graph, 'epistemic_drift_score') else {
-        "cumulative_drift_score": 0.0,
-        "drift_velocity": 0.0,
-        "turns_since_last_drift": 0,
-        "total_drift_events": 0,
-        "last_drift_update_turn": 0,
-        "is_recovering": False
-    }
+    drift_summary = get_drift_summary(graph)
 
     # Phase 4 (Drift Accumulator): Stance tracking metrics
     stance_metrics = {
-        "topics_tracked": len(graph.topic_stance_history) if hasattr(graph, 'topic_stance_history') else 0,
+        "topics_tracked": len(graph.topic_stance_history),
         "total_stance_points": sum(
             len(history) for history in graph.topic_stance_history.values()
-        ) if hasattr(graph, 'topic_stance_history') else 0,
+        ),
         "topic_variances": {}
     }
 
-    if hasattr(graph, 'topic_stance_history'):
-        for topic_id, stance_history in graph.topic_stance_history.items():
-            variance = compute_topic_stance_variance(stance_history)
-            stance_metrics["topic_variances"][topic_id] = round(variance, 3)
+    for topic_id, stance_history in graph.topic_stance_history.items():
+        variance = compute_topic_stance_variance(stance_history)
+        stance_metrics["topic_variances"][topic_id] = round(variance, 3)
 
     # Phase 4 (Drift Accumulator): Dependency metrics
     dependency_metrics = get_dependency_metrics(graph)
@@ -171,16 +158,16 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
         "alerts": {
             "total": len(graph.alerts),
             "by_type": {
-                "polarity_flip": len(polarity_flip_alerts),
-                "assumption_drop": len(assumption_drop_alerts),
-                "agreement_bias": len(agreement_bias_alerts),
-                "confidence_drift": len(confidence_drift_alerts)
+                "polarity_flip": alerts_by_type["polarity_flip"],
+                "assumption_drop": alerts_by_type["assumption_drop"],
+                "agreement_bias": alerts_by_type["agreement_bias"],
+                "confidence_drift": alerts_by_type["confidence_drift"]
             },
             "by_severity": {
-                "critical": len(critical_alerts),
-                "high": len(high_alerts),
-                "medium": len(medium_alerts),
-                "low": len(low_alerts)
+                "critical": alerts_by_severity["critical"],
+                "high": alerts_by_severity["high"],
+                "medium": alerts_by_severity["medium"],
+                "low": alerts_by_severity["low"]
             }
         },
         "health_score": round(health_score, 1),
@@ -201,12 +188,12 @@ def compute_epistemic_metrics(graph: CommitmentGraph) -> Dict[str, Any]:
         },
         "k2_authority": {
             "total_verifications": len(k2_overrides_list),
-            "overrides": len(false_positives),
+            "overrides": overrides_by_type["false_positive"],
             "severity_adjustments": {
-                "upgrades": len(upgrades),
-                "downgrades": len(downgrades)
+                "upgrades": overrides_by_type["severity_upgrade"],
+                "downgrades": overrides_by_type["severity_downgrade"]
             },
-            "false_positive_corrections": len(false_positives),
+            "false_positive_corrections": overrides_by_type["false_positive"],
             "precision_estimate": round(k2_precision, 3)
         },
         "async_processing": {
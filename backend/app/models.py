@@ -5,11 +5,18 @@ This module defines the core data structures for representing
 conversations, commitments, assumptions, and epistemic drift alerts.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Literal, Any
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic.dataclasses import dataclass
+from dataclasses import field
+from typing import List, Optional, Dict, Literal, Any, Callable
 from datetime import datetime
+from bisect import bisect_left
 import hashlib
-import json
+import heapq
+
+
+# Modulus for the additive per-list ID digests in CommitmentGraph.compute_hash
+_HASH_MODULUS = 1 << 256
 
 
 class Turn(BaseModel):
@@ -33,11 +40,14 @@ class Assumption(BaseModel):
     confidence: float = Field(0.5, ge=0.0, le=1.0)
 
 
-class Commitment(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Commitment:
     """
     A claim, position, goal, or assumption extracted from a turn.
 
     Represents a statement that can be tracked for consistency over time.
+    Slotted dataclass: long conversations hold thousands of these, so
+    instances carry no per-object __dict__.
     """
     id: str  # e.g., "c1", "c2"
     turn_id: int
@@ -45,29 +55,25 @@ class Commitment(BaseModel):
     normalized: str  # Canonical text for matching/comparison
     polarity: Optional[Literal["positive", "negative", "neutral"]] = "neutral"
     confidence: float = Field(0.5, ge=0.0, le=1.0)
-    assumptions: List[str] = []  # List of assumption IDs
-    sources: List[str] = []  # Source turn IDs or external refs
+    assumptions: List[str] = field(default_factory=list)  # List of assumption IDs
+    sources: List[str] = field(default_factory=list)  # Source turn IDs or external refs
     timestamp: datetime
 
     # Phase 2: Epistemic state tracking
     active: bool = True
     overridden_by: Optional[str] = None
-    contradicted_by: List[str] = []
+    contradicted_by: List[str] = field(default_factory=list)
     stability_score: float = 1.0
 
     # Phase 4 (Drift Accumulator): Dependency tracking
-    depended_on_by: List[str] = []  # Which commitments depend on this one
+    depended_on_by: List[str] = field(default_factory=list)  # Which commitments depend on this one
 
     # Topic-Anchor Based Detection: Primary topic for contradiction matching
     topic_anchor: Optional[str] = None  # e.g., "python", "microservices", "typescript"
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
-class Edge(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Edge:
     """
     A relationship between two commitments in the graph.
 
@@ -94,6 +100,7 @@ class DriftEvent(BaseModel):
     timestamp: datetime
 
     class Config:
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
@@ -102,12 +109,14 @@ class DriftEvent(BaseModel):
 class StancePoint(BaseModel):
     """Stance measurement at a point in time."""
     topic: str
-    stance: float = Field(ge=-1.0, le=1.0)  # -1.0 (strongly negative) to +1.0 (strongly positive)
+    # Internal-only: compute_stance_point keeps these in range by construction
+    stance: float  # -1.0 (strongly negative) to +1.0 (strongly positive)
     turn_id: int
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: float  # 0.0 to 1.0
     timestamp: datetime
 
     class Config:
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
@@ -123,7 +132,8 @@ class TopicCluster(BaseModel):
     last_updated_turn: int
 
 
-class Alert(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Alert:
     """A detected instance of epistemic drift or inconsistency."""
     id: str
     severity: Literal["low", "medium", "high", "critical"]
@@ -143,12 +153,7 @@ class Alert(BaseModel):
     timestamp: datetime
 
     # Phase 3: Track K2 verification status
-    metadata: Dict[str, Any] = {}  # Can store "pending_k2", "k2_verified", etc.
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    metadata: Dict[str, Any] = field(default_factory=dict)  # Can store "pending_k2", "k2_verified", etc.
 
 
 class EscalationDecision(BaseModel):
@@ -218,7 +223,7 @@ class CommitmentGraph(BaseModel):
     metadata: Dict = {}
 
     # Phase 3: K2 authority tracking
-    k2_overrides: List[K2Override] = []
+    k2_overrides: List[K2Override] = Field(default_factory=list)
 
     # Phase 3: Versioning for race condition handling
     version: int = 0
@@ -233,31 +238,66 @@ class CommitmentGraph(BaseModel):
     turns_since_last_drift: int = 0
 
     # Phase 4 (Drift Accumulator): Topic tracking
-    topic_stance_history: Dict[str, List[StancePoint]] = {}
+    topic_stance_history: Dict[str, List[StancePoint]] = Field(default_factory=dict)
     topic_clusters: List[TopicCluster] = []
 
+    # Running values over the append-only lists, keyed by name (see _fold)
+    _folds: Dict[str, tuple] = PrivateAttr(default_factory=dict)
+
+    # Active commitment IDs that topic_clusters was last computed from
+    _clustered_commitment_ids: Optional[tuple] = PrivateAttr(default=None)
+
     def compute_hash(self) -> str:
         """
         Compute a stable hash of the graph for caching.
 
-        Returns a SHA256 hash based on turn IDs and commitment IDs.
+        Returns a 256-bit BLAKE2b hex digest based on turn IDs, commitment
+        IDs and alert IDs. Each ID list keeps a running digest that only
+        consumes the items appended since the previous call; the section
+        digests are then folded together with the conversation ID.
         Useful for detecting when re-analysis is needed.
         """
-        fingerprint = {
-            "conversation_id": self.conversation_id,
-            "turn_ids": [t.id for t in self.turns],
-            "commitment_ids": [c.id for c in self.commitments],
-            "alert_ids": [a.id for a in self.alerts]
-        }
-        hash_input = json.dumps(fingerprint, sort_keys=True)
-        return hashlib.sha256(hash_input.encode()).hexdigest()
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(self.conversation_id.encode())
+        for section, items in (
+            ("turns", self.turns),
+            ("commitments", self.commitments),
+            ("alerts", self.alerts),
+        ):
+            hasher.update(b"\x1e")
+            total = self._fold(f"hash_{section}", items, int, _add_id_hashes)
+            hasher.update(total.to_bytes(32, "big"))
+        return hasher.hexdigest()
+
+    def _fold(
+        self,
+        name: str,
+        items: list,
+        initial: Callable[[], Any],
+        extend: Callable[[Any, list, int], Any]
+    ) -> Any:
+        """
+        Running value over an append-only list, updated incrementally.
+
+        extend(value, items, start) folds items[start:] into value, so each
+        call only consumes the items appended since the previous call under
+        the same name. The value restarts from initial() if the list is
+        replaced or shrinks.
+        """
+        state = self._folds.get(name)
+        if state is None or state[0] is not items or len(items) < state[1]:
+            value, start = initial(), 0
+        else:
+            _, start, value = state
+
+        value = extend(value, items, start)
+        self._folds[name] = (items, len(items), value)
+        return value
 
     def get_commitment(self, commitment_id: str) -> Optional[Commitment]:
         """Retrieve a commitment by ID."""
-        for c in self.commitments:
-            if c.id == commitment_id:
-                return c
-        return None
+        index = self._fold("commitment_ids", self.commitments, dict, _index_ids)
+        return index.get(commitment_id)
 
     def get_turn(self, turn_id: int) -> Optional[Turn]:
         """Retrieve a turn by ID."""
@@ -266,6 +306,20 @@ class CommitmentGraph(BaseModel):
                 return t
         return None
 
+    def drift_event_positions(self, turn_ids) -> List[int]:
+        """
+        Positions in drift_events of the events detected at any of turn_ids.
+
+        Uses a running detected_at_turn -> positions index. Positions are
+        returned in list order.
+        """
+        index = self._fold("drift_turns", self.drift_events, dict, _index_drift_turns)
+        return sorted(
+            position
+            for turn_id in turn_ids
+            for position in index.get(turn_id, ())
+        )
+
     def latest_turn_id(self) -> int:
         """Get the ID of the most recent turn."""
         return max([t.id for t in self.turns]) if self.turns else 0
@@ -287,9 +341,85 @@ class CommitmentGraph(BaseModel):
         """Get all currently active commitments."""
         return [c for c in self.commitments if c.active]
 
+    def recent_active_commitments(self, before_turn_id: int, limit: int) -> List[Commitment]:
+        """
+        The `limit` latest active commitments from turns before before_turn_id.
+
+        Same result as heapq.nlargest(limit, ..., key=turn_id) over every
+        active earlier commitment. While commitments are appended in turn
+        order (the usual case) a bisect over a running turn_id column finds
+        the cut-off and only the tail is walked, back to the first turn
+        boundary past `limit` active candidates; otherwise the whole list is
+        scanned.
+        """
+        commitments = self.commitments
+        turn_ids, in_order = self._fold(
+            "commitment_turns", commitments, lambda: ([], True), _append_turn_ids
+        )
+
+        if in_order:
+            candidates = []
+            position = bisect_left(turn_ids, before_turn_id)
+            while position > 0:
+                position -= 1
+                c = commitments[position]
+                if len(candidates) >= limit and c.turn_id != candidates[-1].turn_id:
+                    break
+                if c.active:
+                    candidates.append(c)
+            candidates.reverse()
+        else:
+            candidates = (c for c in commitments if c.turn_id < before_turn_id and c.active)
+
+        return heapq.nlargest(limit, candidates, key=lambda c: c.turn_id)
+
     def count_contradictions(self) -> int:
         """Count total number of contradiction relationships in graph."""
-        return sum(1 for e in self.edges if e.relation == "contradicts")
+        return self._fold("contradictions", self.edges, int, _count_contradicts)
+
+
+# Fold steps for CommitmentGraph._fold: each folds items[start:] into value
+
+def _add_id_hashes(total: int, items: list, start: int) -> int:
+    """
+    Additive digest of item IDs: each adds hash(position, id) modulo 2**256,
+    so the result does not depend on how often it was extended.
+    """
+    for position in range(start, len(items)):
+        item_hash = hashlib.blake2b(
+            f"{position}:{items[position].id}".encode(), digest_size=32
+        ).digest()
+        total = (total + int.from_bytes(item_hash, "big")) % _HASH_MODULUS
+    return total
+
+
+def _index_ids(index: dict, items: list, start: int) -> dict:
+    """ID -> item; the first item wins for duplicate IDs, like a linear scan."""
+    for item in items[start:]:
+        index.setdefault(item.id, item)
+    return index
+
+
+def _index_drift_turns(index: dict, events: list, start: int) -> dict:
+    """detected_at_turn -> positions of the drift events detected there."""
+    for position in range(start, len(events)):
+        index.setdefault(events[position].detected_at_turn, []).append(position)
+    return index
+
+
+def _append_turn_ids(column: tuple, commitments: list, start: int) -> tuple:
+    """Commitment turn_id column, plus whether it is still in turn order."""
+    turn_ids, in_order = column
+    for c in commitments[start:]:
+        if turn_ids and c.turn_id < turn_ids[-1]:
+            in_order = False
+        turn_ids.append(c.turn_id)
+    return turn_ids, in_order
+
+
+def _count_contradicts(count: int, edges: list, start: int) -> int:
+    """Number of contradiction edges."""
+    return count + sum(1 for e in edges[start:] if e.relation == "contradicts")
 
 
 # API Request/Response Models
@@ -310,6 +440,26 @@ class AnalyzeTurnResponse(BaseModel):
     cache_hit: bool = False
 
 
+class AnalyzeTurnsBatchRequest(BaseModel):
+    """Request to analyze several consecutive turns of one conversation."""
+    conversation_id: str
+    turns: List[Turn]
+
+
+class TurnAnalysisResult(BaseModel):
+    """Per-turn outcome inside a batch analysis response."""
+    turn_id: int
+    alerts: List[Alert]
+    suggested_message: Optional[str] = None
+    cost_estimate: Dict[str, Any] = {"k2_calls": 0, "tokens_used": 0}
+
+
+class AnalyzeTurnsBatchResponse(BaseModel):
+    """Response with the final graph and the results of each turn."""
+    updated_graph: CommitmentGraph
+    results: List[TurnAnalysisResult]
+
+
 class ReconcileRequest(BaseModel):
     """Request to generate a reconciliation message."""
     conversation_id: str
@@ -14,6 +14,93 @@ import re
 from typing import Literal, Tuple, List
 
 
+# Compiled pattern tables, built once at import time.
+# Each entry is (pattern, weight); a match adds the weight to the score.
+
+# Negation scope
+# Pattern: "not [article?] [positive word]" -> negative
+# Allow optional articles (a, an, the) between negation and positive word
+_NEGATED_POSITIVE_PATTERNS = [
+    (re.compile(r'\b(?:not|no|never|n\'t)\s+(?:a|an|the)?\s*(?:good|great|excellent|better|best|essential|important|valuable|beneficial|should|must|can|recommend|prefer|ideal)\b'), -1.5),
+    (re.compile(r'\b(?:shouldn\'t|can\'t|won\'t|don\'t|isn\'t|aren\'t|wasn\'t|weren\'t|hasn\'t|haven\'t)\b'), -0.8),
+    (re.compile(r'\b(?:not|n\'t)\s+(?:ideal|great|good|the\s+best|recommended|suitable|appropriate|right)\b'), -1.0),
+    (re.compile(r'\bdisagree\b'), -0.7),
+]
+
+# Pattern: "not [negative word]" -> could be positive
+_NEGATED_NEGATIVE_PATTERNS = [
+    (re.compile(r'\b(?:not|no|never)\s+(?:bad|wrong|terrible|worse|worst|avoid|poor)\b'), 0.8),
+]
+
+# Comparatives
+_POSITIVE_COMPARATIVES = [
+    (re.compile(r'\b(?:better|superior|improved|enhanced|preferable|more\s+effective)\b'), 1.0),
+    (re.compile(r'\b(?:best|optimal|ideal|perfect)\b'), 1.2),
+]
+
+_NEGATIVE_COMPARATIVES = [
+    (re.compile(r'\b(?:worse|inferior|degraded|less\s+effective|problematic)\b'), -1.0),
+    (re.compile(r'\b(?:worst|terrible|awful)\b'), -1.2),
+    # Negated positives: "not better", "isn't ideal", "aren't the best"
+    (re.compile(r'\b(?:not|n\'t)\s+(?:a\s+)?(?:better|superior|best|optimal|ideal|perfect|preferable|more\s+effective)\b'), -1.5),
+    (re.compile(r'\b(?:isn\'t|aren\'t|wasn\'t|weren\'t)\s+(?:better|superior|best|optimal|ideal|perfect|preferable|great|good|the\s+best)\b'), -1.5),
+]
+
+# Modals
+# Affirmative modals (in positive context)
+_AFFIRMATIVE_MODALS = [
+    (re.compile(r'\b(?:should|must|ought\s+to|need\s+to)\s+(?!not)\w+'), 0.8),
+    (re.compile(r'\b(?:will|can)\s+(?!not)\w+'), 0.6),
+]
+
+_NEGATED_MODALS = [
+    (re.compile(r'\b(?:should\s+not|shouldn\'t|must\s+not|mustn\'t|cannot|can\'t)\b'), -0.8),
+    (re.compile(r'\b(?:won\'t|will\s+not)\b'), -0.6),
+]
+
+# Uncertainty markers (reduce scores)
+_UNCERTAINTY_MARKERS = [
+    (re.compile(r'\b(?:might|may|could|perhaps|possibly|maybe)\b'), -0.2),
+]
+
+# Sentiment phrases (counted, not weighted)
+_POSITIVE_PHRASES = [
+    re.compile(r'\b(?:agree|correct|true|yes|right)\b'),
+    re.compile(r'\b(?:good|great|excellent|wonderful|fantastic|essential|important|valuable|beneficial)\b'),
+    re.compile(r'\b(?:recommend|endorse|support|advocate)\b'),
+    re.compile(r'\b(?:safe|secure|reliable|stable)\b'),
+]
+
+_NEGATIVE_PHRASES = [
+    re.compile(r'\b(?:disagree|false|wrong|incorrect)\b'),
+    re.compile(r'\b(?:bad|poor|terrible|awful|horrible|harmful|useless|pointless|unnecessary)\b'),
+    re.compile(r'\b(?:avoid|discourage|oppose|reject)\b'),
+    re.compile(r'\b(?:unsafe|dangerous|risky|unstable)\b'),
+]
+# Pattern tables each feature helper reduces over in a single pass
+_NEGATION_TABLE = _NEGATED_POSITIVE_PATTERNS + _NEGATED_NEGATIVE_PATTERNS
+_COMPARATIVE_TABLE = _POSITIVE_COMPARATIVES + _NEGATIVE_COMPARATIVES
+_MODAL_TABLE = _AFFIRMATIVE_MODALS + _NEGATED_MODALS + _UNCERTAINTY_MARKERS
+
+# Every pattern above fused into one alternation. A single scan tells us
+# whether ANY pattern matches; when none does, every feature score is zero
+# and the text is neutral, so the per-pattern passes can be skipped.
+_ANY_POLARITY_PATTERN = re.compile("|".join(
+    f"(?:{pattern.pattern})"
+    for pattern in (
+        [p for p, _ in _NEGATED_POSITIVE_PATTERNS]
+        + [p for p, _ in _NEGATED_NEGATIVE_PATTERNS]
+        + [p for p, _ in _POSITIVE_COMPARATIVES]
+        + [p for p, _ in _NEGATIVE_COMPARATIVES]
+        + [p for p, _ in _AFFIRMATIVE_MODALS]
+        + [p for p, _ in _NEGATED_MODALS]
+        + [p for p, _ in _UNCERTAINTY_MARKERS]
+        + _POSITIVE_PHRASES
+        + _NEGATIVE_PHRASES
+    )
+))
+
+
 def infer_polarity_structural(text: str) -> Literal["positive", "negative", "neutral"]:
     """
     Infer polarity from text using structural analysis.
@@ -32,37 +119,52 @@ def infer_polarity_structural(text: str) -> Literal["positive", "negative", "neu
     """
     text_lower = text.lower().strip()
 
-    # Initialize scores
-    positive_score = 0.0
-    negative_score = 0.0
+    # 0. FUSED PRE-SCAN: no polarity pattern anywhere -> neutral
+    if not _ANY_POLARITY_PATTERN.search(text_lower):
+        return "neutral"
 
-    # 1. NEGATION SCOPE ANALYSIS
-    negation_score = _analyze_negation_scope(text_lower)
-    if negation_score < 0:
-        negative_score += abs(negation_score)
-    elif negation_score > 0:
-        positive_score += negation_score
+    return _combine_feature_scores(
+        _analyze_negation_scope(text_lower),  # 1. NEGATION SCOPE ANALYSIS
+        _analyze_comparatives(text_lower),    # 2. COMPARATIVE PATTERN DETECTION
+        _analyze_modals(text_lower),          # 3. MODAL VERB ANALYSIS
+        _aggregate_sentiment(text_lower),     # 4. SENTIMENT AGGREGATION
+    )
 
-    # 2. COMPARATIVE PATTERN DETECTION
-    comparative_score = _analyze_comparatives(text_lower)
-    if comparative_score < 0:
-        negative_score += abs(comparative_score)
-    elif comparative_score > 0:
-        positive_score += comparative_score
 
-    # 3. MODAL VERB ANALYSIS
-    modal_score = _analyze_modals(text_lower)
-    if modal_score < 0:
-        negative_score += abs(modal_score)
-    elif modal_score > 0:
-        positive_score += modal_score
+def infer_polarity_structural_batch(texts: List[str]) -> List[Literal["positive", "negative", "neutral"]]:
+    """
+    Infer polarity for several texts at once.
 
-    # 4. SENTIMENT AGGREGATION
-    sentiment_score = _aggregate_sentiment(text_lower)
-    if sentiment_score < 0:
-        negative_score += abs(sentiment_score)
-    elif sentiment_score > 0:
-        positive_score += sentiment_score
+    Texts that normalize to the same lowercase string are analyzed only
+    once, which matters when a turn repeats a phrase or a graph is rebuilt.
+
+    Args:
+        texts: Input texts to analyze
+
+    Returns:
+        Polarities in the same order as texts
+    """
+    polarity_by_text = {}
+    polarities = []
+
+    for text in texts:
+        key = text.lower().strip()
+        if key not in polarity_by_text:
+            polarity_by_text[key] = infer_polarity_structural(key)
+        polarities.append(polarity_by_text[key])
+
+    return polarities
+
+
+def _combine_feature_scores(*feature_scores: float) -> Literal["positive", "negative", "neutral"]:
+    """
+    Combine signed feature scores into a final polarity.
+
+    Negative feature scores accumulate as negative evidence and positive
+    ones as positive evidence; the larger side wins if it clears 0.25.
+    """
+    positive_score = sum((score for score in feature_scores if score > 0), 0.0)
+    negative_score = sum((-score for score in feature_scores if score < 0), 0.0)
 
     # Final decision (lowered threshold from 0.5 to 0.25)
     if negative_score > positive_score and negative_score > 0.25:
@@ -80,32 +182,7 @@ def _analyze_negation_scope(text: str) -> float:
     Returns:
         Score: negative for negated positive, positive for negated negative, 0 for neutral
     """
-    score = 0.0
-
-    # Negation patterns with scope
-    # Pattern: "not [article?] [positive word]" -> negative
-    # Allow optional articles (a, an, the) between negation and positive word
-    negated_positive_patterns = [
-        (r'\b(?:not|no|never|n\'t)\s+(?:a|an|the)?\s*(?:good|great|excellent|better|best|essential|important|valuable|beneficial|should|must|can|recommend|prefer|ideal)\b', -1.5),
-        (r'\b(?:shouldn\'t|can\'t|won\'t|don\'t|isn\'t|aren\'t|wasn\'t|weren\'t|hasn\'t|haven\'t)\b', -0.8),
-        (r'\b(?:not|n\'t)\s+(?:ideal|great|good|the\s+best|recommended|suitable|appropriate|right)\b', -1.0),
-        (r'\bdisagree\b', -0.7),
-    ]
-
-    # Pattern: "not [negative word]" -> could be positive
-    negated_negative_patterns = [
-        (r'\b(?:not|no|never)\s+(?:bad|wrong|terrible|worse|worst|avoid|poor)\b', 0.8),
-    ]
-
-    for pattern, weight in negated_positive_patterns:
-        if re.search(pattern, text):
-            score += weight
-
-    for pattern, weight in negated_negative_patterns:
-        if re.search(pattern, text):
-            score += weight
-
-    return score
+    return _weighted_score(text, _NEGATION_TABLE)
 
 
 def _analyze_comparatives(text: str) -> float:
@@ -115,32 +192,7 @@ def _analyze_comparatives(text: str) -> float:
     Returns:
         Score: positive for favorable comparisons, negative for unfavorable
     """
-    score = 0.0
-
-    # Positive comparatives
-    positive_comparatives = [
-        (r'\b(?:better|superior|improved|enhanced|preferable|more\s+effective)\b', 1.0),
-        (r'\b(?:best|optimal|ideal|perfect)\b', 1.2),
-    ]
-
-    # Negative comparatives
-    negative_comparatives = [
-        (r'\b(?:worse|inferior|degraded|less\s+effective|problematic)\b', -1.0),
-        (r'\b(?:worst|terrible|awful)\b', -1.2),
-        # Negated positives: "not better", "isn't ideal", "aren't the best"
-        (r'\b(?:not|n\'t)\s+(?:a\s+)?(?:better|superior|best|optimal|ideal|perfect|preferable|more\s+effective)\b', -1.5),
-        (r'\b(?:isn\'t|aren\'t|wasn\'t|weren\'t)\s+(?:better|superior|best|optimal|ideal|perfect|preferable|great|good|the\s+best)\b', -1.5),
-    ]
-
-    for pattern, weight in positive_comparatives:
-        if re.search(pattern, text):
-            score += weight
-
-    for pattern, weight in negative_comparatives:
-        if re.search(pattern, text):
-            score += weight
-
-    return score
+    return _weighted_score(text, _COMPARATIVE_TABLE)
 
 
 def _analyze_modals(text: str) -> float:
@@ -150,38 +202,12 @@ def _analyze_modals(text: str) -> float:
     Returns:
         Score: positive for affirmative modals, negative for negated modals
     """
-    score = 0.0
-
-    # Affirmative modals (in positive context)
-    affirmative_modals = [
-        (r'\b(?:should|must|ought\s+to|need\s+to)\s+(?!not)\w+', 0.8),
-        (r'\b(?:will|can)\s+(?!not)\w+', 0.6),
-    ]
-
-    # Negated modals
-    negated_modals = [
-        (r'\b(?:should\s+not|shouldn\'t|must\s+not|mustn\'t|cannot|can\'t)\b', -0.8),
-        (r'\b(?:won\'t|will\s+not)\b', -0.6),
-    ]
-
-    # Uncertainty markers (reduce scores)
-    uncertainty = [
-        (r'\b(?:might|may|could|perhaps|possibly|maybe)\b', -0.2),
-    ]
+    return _weighted_score(text, _MODAL_TABLE)
 
-    for pattern, weight in affirmative_modals:
-        if re.search(pattern, text):
-            score += weight
 
-    for pattern, weight in negated_modals:
-        if re.search(pattern, text):
-            score += weight
-
-    for pattern, weight in uncertainty:
-        if re.search(pattern, text):
-            score += weight
-
-    return score
+def _weighted_score(text: str, table: List[Tuple[re.Pattern, float]]) -> float:
+    """Sum the weights of every (pattern, weight) entry that matches text."""
+    return sum((weight for pattern, weight in table if pattern.search(text)), 0.0)
 
 
 def _aggregate_sentiment(text: str) -> float:
@@ -191,22 +217,8 @@ def _aggregate_sentiment(text: str) -> float:
     Returns:
         Score: net sentiment (positive - negative)
     """
-    positive_phrases = [
-        r'\b(?:agree|correct|true|yes|right)\b',
-        r'\b(?:good|great|excellent|wonderful|fantastic|essential|important|valuable|beneficial)\b',
-        r'\b(?:recommend|endorse|support|advocate)\b',
-        r'\b(?:safe|secure|reliable|stable)\b',
-    ]
-
-    negative_phrases = [
-        r'\b(?:disagree|false|wrong|incorrect)\b',
-        r'\b(?:bad|poor|terrible|awful|horrible|harmful|useless|pointless|unnecessary)\b',
-        r'\b(?:avoid|discourage|oppose|reject)\b',
-        r'\b(?:unsafe|dangerous|risky|unstable)\b',
-    ]
-
-    positive_count = sum(1 for pattern in positive_phrases if re.search(pattern, text))
-    negative_count = sum(1 for pattern in negative_phrases if re.search(pattern, text))
+    positive_count = sum(1 for pattern in _POSITIVE_PHRASES if pattern.search(text))
+    negative_count = sum(1 for pattern in _NEGATIVE_PHRASES if pattern.search(text))
 
     # Normalize to 0.0-1.0 range
     net_sentiment = (positive_count - negative_count) * 0.3
@@ -222,10 +234,28 @@ def extract_polarity_features(text: str) -> dict:
     """
     text_lower = text.lower().strip()
 
+    # Same fused pre-scan as infer_polarity_structural: no match means
+    # every feature score is zero
+    if not _ANY_POLARITY_PATTERN.search(text_lower):
+        return {
+            "negation_score": 0.0,
+            "comparative_score": 0.0,
+            "modal_score": 0.0,
+            "sentiment_score": 0.0,
+            "final_polarity": "neutral"
+        }
+
+    negation_score = _analyze_negation_scope(text_lower)
+    comparative_score = _analyze_comparatives(text_lower)
+    modal_score = _analyze_modals(text_lower)
+    sentiment_score = _aggregate_sentiment(text_lower)
+
     return {
-        "negation_score": _analyze_negation_scope(text_lower),
-        "comparative_score": _analyze_comparatives(text_lower),
-        "modal_score": _analyze_modals(text_lower),
-        "sentiment_score": _aggregate_sentiment(text_lower),
-        "final_polarity": infer_polarity_structural(text)
+        "negation_score": negation_score,
+        "comparative_score": comparative_score,
+        "modal_score": modal_score,
+        "sentiment_score": sentiment_score,
+        "final_polarity": _combine_feature_scores(
+            negation_score, comparative_score, modal_score, sentiment_score
+        )
     }
@@ -9,8 +9,13 @@ This module provides:
 Phase 4 (Drift Accumulator): Tracks multi-turn stance evolution per topic.
 """
 
+import heapq
+import re
 from typing import List, Dict, Tuple
+from collections import Counter
+from itertools import combinations
 from datetime import datetime
+from statistics import fmean
 from app.models import (
     CommitmentGraph,
     Commitment,
@@ -19,6 +24,21 @@ from app.models import (
 )
 
 
+# Simple stopwords excluded from topic labels
+_LABEL_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "be", "been",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "can", "i", "you", "we", "they",
+    "he", "she", "it", "this", "that", "these", "those"
+})
+
+# Whitespace-delimited token with surrounding punctuation trimmed
+_LABEL_TOKEN_RE = re.compile(
+    r"""[^\s.,!?;:'"()\[\]{}](?:\S*[^\s.,!?;:'"()\[\]{}])?"""
+)
+
+
 def cluster_commitment_topics(
     graph: CommitmentGraph,
     similarity_threshold: float = 0.4
@@ -41,40 +61,62 @@ def cluster_commitment_topics(
     if not active_commitments:
         return []
 
-    # Build similarity matrix
+    # Pairwise similarities (sparse: only pairs sharing a token are stored)
     n = len(active_commitments)
-    clusters: List[List[Commitment]] = [[c] for c in active_commitments]
-    cluster_ids = list(range(n))
+    pair_similarity = _pairwise_token_similarities(
+        [c.normalized for c in active_commitments]
+    )
 
-    # Simple agglomerative clustering
-    while True:
+    # Cluster state keyed by a stable cluster ID: the lowest original index
+    # of its members, so cluster IDs keep the positional order used for
+    # tie-breaking between equally similar pairs.
+    members: Dict[int, List[Commitment]] = {i: [c] for i, c in enumerate(active_commitments)}
+    links: Dict[int, Dict[int, float]] = {i: {} for i in range(n)}
+    for (i, j), sim in pair_similarity.items():
+        links[i][j] = sim
+        links[j][i] = sim
+
+    # Average-linkage agglomerative clustering. links[a][b] holds the sum of
+    # pairwise similarities between clusters a and b, so the average is
+    # links[a][b] / (|a| * |b|) and a merge only needs to add two rows.
+    # Candidate merges sit in a heap ordered by (-similarity, a, b); entries
+    # are stamped with cluster versions and skipped once either side changes.
+    version = [0] * n
+    heap = [(-sim, i, j, 0, 0) for (i, j), sim in pair_similarity.items()]
+    heapq.heapify(heap)
+
+    while heap:
         # Find most similar pair of clusters
-        best_similarity = 0.0
-        best_pair = None
-
-        for i in range(len(clusters)):
-            for j in range(i + 1, len(clusters)):
-                # Compute average similarity between all pairs in clusters
-                similarities = []
-                for c1 in clusters[i]:
-                    for c2 in clusters[j]:
-                        sim = _compute_similarity(c1.normalized, c2.normalized)
-                        similarities.append(sim)
-
-                if similarities:
-                    avg_sim = sum(similarities) / len(similarities)
-                    if avg_sim > best_similarity:
-                        best_similarity = avg_sim
-                        best_pair = (i, j)
+        neg_similarity, a, b, version_a, version_b = heapq.heappop(heap)
+        if (
+            a not in members or b not in members
+            or version[a] != version_a or version[b] != version_b
+        ):
+            continue
 
         # If no pair exceeds threshold, stop
-        if best_similarity < similarity_threshold or best_pair is None:
+        if -neg_similarity < similarity_threshold:
             break
 
-        # Merge the best pair
-        i, j = best_pair
-        clusters[i].extend(clusters[j])
-        del clusters[j]
+        # Merge the best pair (b folds into the lower-indexed a)
+        members[a].extend(members.pop(b))
+        version[a] += 1
+        for other, link_sum in links.pop(b).items():
+            if other == a:
+                continue
+            links[a][other] = links[a].get(other, 0.0) + link_sum
+            links[other][a] = links[a][other]
+            del links[other][b]
+        del links[a][b]
+
+        for other, link_sum in links[a].items():
+            low, high = (a, other) if a < other else (other, a)
+            heapq.heappush(heap, (
+                -(link_sum / (len(members[low]) * len(members[high]))),
+                low, high, version[low], version[high]
+            ))
+
+    clusters = list(members.values())
 
     # Convert clusters to TopicCluster objects
     topic_clusters = []
@@ -85,15 +127,20 @@ def cluster_commitment_topics(
         # Get commitment IDs
         commitment_ids = [c.id for c in cluster_commitments]
 
-        # Get centroid text (longest commitment)
-        centroid_text = max(cluster_commitments, key=lambda c: len(c.normalized)).normalized
-
-        # Get first and last seen turns
-        turn_ids = [c.turn_id for c in cluster_commitments]
-        first_seen = min(turn_ids)
-        last_updated = max(turn_ids)
-
-        topic_cluster = TopicCluster(
+        # Get centroid text (longest commitment, first on ties) and the
+        # first and last seen turns in a single pass
+        centroid_text = cluster_commitments[0].normalized
+        first_seen = last_updated = cluster_commitments[0].turn_id
+        for c in cluster_commitments[1:]:
+            if len(c.normalized) > len(centroid_text):
+                centroid_text = c.normalized
+            if c.turn_id < first_seen:
+                first_seen = c.turn_id
+            elif c.turn_id > last_updated:
+                last_updated = c.turn_id
+
+        # Built from already-validated commitments; skip re-validation
+        topic_cluster = TopicCluster.model_construct(
             topic_id=f"topic_{idx + 1}",
             topic_label=topic_label,
             commitment_ids=commitment_ids,
@@ -135,7 +182,9 @@ def compute_stance_point(
     polarity_value = polarity_map.get(commitment.polarity, 0.0)
     stance = polarity_value * commitment.confidence
 
-    return StancePoint(
+    # Stance is in [-1, 1] by construction (unit polarity x validated
+    # confidence), so the range validators can be skipped
+    return StancePoint.model_construct(
         topic=topic_id,
         stance=stance,
         turn_id=commitment.turn_id,
@@ -157,11 +206,17 @@ def update_topic_stance_history(
         graph: Commitment graph to update
         new_commitments: New commitments to add to stance history
     """
-    # Re-cluster all commitments
-    topic_clusters = cluster_commitment_topics(graph)
-
-    # Update graph's topic clusters
-    graph.topic_clusters = topic_clusters
+    # Re-cluster only when the active commitment set changed since the
+    # last pass; clustering is a pure function of that (ordered) set
+    active_key = tuple(c.id for c in graph.get_active_commitments())
+    if active_key == graph._clustered_commitment_ids:
+        topic_clusters = graph.topic_clusters
+    else:
+        topic_clusters = cluster_commitment_topics(graph)
+
+        # Update graph's topic clusters
+        graph.topic_clusters = topic_clusters
+        graph._clustered_commitment_ids = active_key
 
     # Build commitment -> topic mapping
     commitment_to_topic = {}
@@ -200,8 +255,8 @@ def compute_topic_stance_variance(
         return 0.0
 
     stances = [sp.stance for sp in stance_history]
-    mean_stance = sum(stances) / len(stances)
-    variance = sum((s - mean_stance) ** 2 for s in stances) / len(stances)
+    mean_stance = fmean(stances)
+    variance = fmean([(s - mean_stance) ** 2 for s in stances])
 
     return variance
 
@@ -229,27 +284,46 @@ def detect_stance_instability(
 
 # Helper functions
 
-def _compute_similarity(text1: str, text2: str) -> float:
+def _pairwise_token_similarities(texts: List[str]) -> Dict[Tuple[int, int], float]:
     """
-    Compute Jaccard similarity between two texts.
+    Compute Jaccard similarity for every pair of texts that share a token.
+
+    Each text is tokenized once and an inverted index (token -> text
+    indices) is used to count intersections, so pairs with no overlap are
+    never visited.
 
     Args:
-        text1: First text
-        text2: Second text
+        texts: Texts to compare
 
     Returns:
-        Similarity score (0.0 to 1.0)
+        Mapping of (i, j) with i < j to similarity; absent pairs are 0.0
     """
-    tokens1 = set(text1.lower().split())
-    tokens2 = set(text2.lower().split())
-
-    if not tokens1 or not tokens2:
-        return 0.0
-
-    intersection = tokens1 & tokens2
-    union = tokens1 | tokens2
+    # Intern tokens to small ints so postings and set sizes are built once
+    vocab: Dict[str, int] = {}
+    postings: List[List[int]] = []
+    sizes: List[int] = []
+    for idx, text in enumerate(texts):
+        tokens = set(text.lower().split())
+        sizes.append(len(tokens))
+        for token in tokens:
+            token_id = vocab.setdefault(token, len(vocab))
+            if token_id == len(postings):
+                postings.append([])
+            postings[token_id].append(idx)
+
+    # Posting lists are in ascending text order, so combinations() yields
+    # (i, j) with i < j directly
+    intersections = Counter(
+        pair
+        for indices in postings
+        if len(indices) > 1
+        for pair in combinations(indices, 2)
+    )
 
-    return len(intersection) / len(union) if union else 0.0
+    return {
+        (i, j): inter / (sizes[i] + sizes[j] - inter)
+        for (i, j), inter in intersections.items()
+    }
 
 
 def _generate_topic_label(commitments: List[Commitment]) -> str:
@@ -264,34 +338,16 @@ def _generate_topic_label(commitments: List[Commitment]) -> str:
     Returns:
         Topic label string
     """
-    # Simple stopwords
-    stopwords = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "be", "been",
-        "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "must", "can", "i", "you", "we", "they",
-        "he", "she", "it", "this", "that", "these", "those"
-    }
-
-    # Collect all tokens
-    all_tokens = []
-    for c in commitments:
-        tokens = c.normalized.lower().split()
-        all_tokens.extend(tokens)
+    text = " ".join(c.normalized for c in commitments).lower()
 
-    # Filter stopwords and count frequency
-    token_freq = {}
-    for token in all_tokens:
-        # Remove punctuation
-        token = token.strip(".,!?;:'\"()[]{}").lower()
-        if token and len(token) > 2 and token not in stopwords:
-            token_freq[token] = token_freq.get(token, 0) + 1
+    # Count non-stopword tokens (punctuation trimmed by the tokenizer)
+    token_freq = Counter(
+        token for token in _LABEL_TOKEN_RE.findall(text)
+        if len(token) > 2 and token not in _LABEL_STOPWORDS
+    )
 
     # Get top 3 most frequent tokens
     if not token_freq:
         return "unknown_topic"
 
-    sorted_tokens = sorted(token_freq.items(), key=lambda x: x[1], reverse=True)
-    top_tokens = [token for token, freq in sorted_tokens[:3]]
-
-    return "_".join(top_tokens)
+    return "_".join(token for token, _ in token_freq.most_common(3))
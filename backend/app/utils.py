@@ -19,7 +19,12 @@ def save_graph_to_cache(conversation_id: str, graph_hash: str):
     graph_cache[conversation_id] = graph_hash
 
 
+# Canonical encoder for cache keys, built once: json.dumps(..., sort_keys=True)
+# would construct a fresh JSONEncoder on every call
+_STABLE_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
 def compute_stable_hash(data: dict) -> str:
-    """Compute SHA256 hash of dictionary for caching."""
-    json_str = json.dumps(data, sort_keys=True)
-    return hashlib.sha256(json_str.encode()).hexdigest()
+    """Compute BLAKE2b (256-bit) hash of dictionary for caching."""
+    json_str = _STABLE_JSON_ENCODER.encode(data)
+    return hashlib.blake2b(json_str.encode(), digest_size=32).hexdigest()
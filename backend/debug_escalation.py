@@ -11,19 +11,21 @@ import json
 async def main():
     BASE_URL = "http://127.0.0.1:8001"
     conversation_id = "debug-test"
+    now_iso = datetime.now().isoformat()
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=120.0, limits=limits) as client:
         # Turn 1: Normal statement
         print("\n=== Turn 1: Normal statement ===")
         response = await client.post(
-            f"{BASE_URL}/analyze-turn",
+            "/analyze-turn",
             json={
                 "conversation_id": conversation_id,
                 "new_turn": {
                     "id": 1,
                     "speaker": "model",
                     "text": "TypeScript is safer than JavaScript",
-                    "ts": datetime.now().isoformat()
+                    "ts": now_iso
                 }
             }
         )
@@ -33,7 +35,7 @@ async def main():
         print(f"Alerts: {len(result['alerts'])}")
 
         # Get full graph
-        response = await client.get(f"{BASE_URL}/conversations/{conversation_id}")
+        response = await client.get(f"/conversations/{conversation_id}")
         graph = response.json()
         escalation_events = graph['metadata'].get('escalation_events', [])
         print(f"Escalation events in metadata: {len(escalation_events)}")
@@ -45,14 +47,14 @@ async def main():
         # Turn 2: Contradictory statement
         print("\n=== Turn 2: Contradictory statement ===")
         response = await client.post(
-            f"{BASE_URL}/analyze-turn",
+            "/analyze-turn",
             json={
                 "conversation_id": conversation_id,
                 "new_turn": {
                     "id": 2,
                     "speaker": "model",
                     "text": "JavaScript is safer than TypeScript",
-                    "ts": datetime.now().isoformat()
+                    "ts": now_iso
                 }
             }
         )
@@ -65,9 +67,12 @@ async def main():
             alert = result['alerts'][0]
             print(f"Alert type: {alert['alert_type']}, severity: {alert['severity']}")
 
-        # Get full graph
-        response = await client.get(f"{BASE_URL}/conversations/{conversation_id}")
-        graph = response.json()
+        # Get full graph and metrics concurrently; the turn is already applied
+        graph_response, metrics_response = await asyncio.gather(
+            client.get(f"/conversations/{conversation_id}"),
+            client.get(f"/conversations/{conversation_id}/metrics"),
+        )
+        graph = graph_response.json()
         escalation_events = graph['metadata'].get('escalation_events', [])
         print(f"\nEscalation events in metadata: {len(escalation_events)}")
         if escalation_events:
@@ -75,9 +80,7 @@ async def main():
             for event in escalation_events:
                 print(f"  - Turn {event['turn_id']}: {event['escalation_reason']} (urgency: {event['urgency']})")
 
-        # Get metrics
-        response = await client.get(f"{BASE_URL}/conversations/{conversation_id}/metrics")
-        metrics = response.json()
+        metrics = metrics_response.json()
         print(f"\nMetrics:")
         print(f"  Total escalations: {metrics['escalation']['total_escalations']}")
         print(f"  Escalation rate: {metrics['escalation']['escalation_rate']}")
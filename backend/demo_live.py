@@ -18,29 +18,31 @@ The sidebar polls every 3 s — you'll see the graph update live.
 """
 
 import sys
-import requests
 from datetime import datetime
 
-API  = "http://localhost:8000"
+from live_client import API_BASE as API, make_client
+
 SEP  = "─" * 60
 
+CLIENT = make_client()
+
 
 def ts():
     return datetime.now().isoformat()
 
 
-def send(conv_id: str, turn_id: int, speaker: str, text: str) -> dict:
+def send(conv_id: str, turn: dict, stamp: str) -> dict:
     payload = {
         "conversation_id": conv_id,
-        "new_turn": {"id": turn_id, "speaker": speaker, "text": text, "ts": ts()},
+        "new_turn": {**turn, "ts": stamp},
     }
-    r = requests.post(f"{API}/analyze-turn", json=payload, timeout=10)
+    r = CLIENT.post("/analyze-turn", json=payload)
     r.raise_for_status()
     return r.json()
 
 
 def metrics(conv_id: str) -> dict:
-    r = requests.get(f"{API}/conversations/{conv_id}/metrics", timeout=5)
+    r = CLIENT.get(f"/conversations/{conv_id}/metrics", timeout=5)
     r.raise_for_status()
     return r.json()
 
@@ -83,10 +85,23 @@ TRIGGER_TURNS = [
 ]
 
 
+def turn_bodies(turns: list, first_id: int) -> list:
+    """Static part of each turn payload (everything but the timestamp)."""
+    return [
+        {"id": turn_id, "speaker": speaker, "text": text}
+        for turn_id, (speaker, text) in enumerate(turns, start=first_id)
+    ]
+
+
+# Built once at import; only "ts" varies per run
+STABLE_BODIES  = turn_bodies(STABLE_TURNS, 1)
+TRIGGER_BODIES = turn_bodies(TRIGGER_TURNS, len(STABLE_TURNS) + 1)
+
+
 def run(conv_id: str):
     # Clear any existing data for a clean start
     try:
-        requests.delete(f"{API}/conversations/{conv_id}", timeout=3)
+        CLIENT.delete(f"/conversations/{conv_id}", timeout=3)
         print("[Cleared previous data]\n")
     except Exception:
         pass
@@ -97,9 +112,10 @@ def run(conv_id: str):
     print("Sending consistent turns… drift should stay at 0.")
     print(SEP)
 
-    for i, (speaker, text) in enumerate(STABLE_TURNS, start=1):
-        result = send(conv_id, i, speaker, text)
-        print_turn(i, speaker, text, result)
+    stamp = ts()  # one timestamp per phase
+    for body in STABLE_BODIES:
+        result = send(conv_id, body, stamp)
+        print_turn(body["id"], body["speaker"], body["text"], result)
 
     m = metrics(conv_id)
     score = m["drift"]["cumulative_drift_score"]
@@ -117,13 +133,14 @@ def run(conv_id: str):
     print("Sending contradicting turns… watch the graph spike.")
     print(SEP)
 
-    turn_id = len(STABLE_TURNS) + 1
-    for i, (speaker, text) in enumerate(TRIGGER_TURNS):
-        result = send(conv_id, turn_id + i, speaker, text)
-        print_turn(turn_id + i, speaker, text, result)
+    stamp = ts()  # one timestamp per phase
+    for i, body in enumerate(TRIGGER_BODIES):
+        result = send(conv_id, body, stamp)
+        print_turn(body["id"], body["speaker"], body["text"], result)
 
-        m = metrics(conv_id)
-        score = m["drift"]["cumulative_drift_score"]
+        # The analyze-turn response already carries the updated graph, so
+        # read the drift score from it instead of a second /metrics round trip
+        score = round(result["updated_graph"]["epistemic_drift_score"], 3)
         label = "ESCALATED ▲" if score >= 2.0 else "building…"
         print(f"       → drift: {score:.3f}  {label}")
 
@@ -148,7 +165,7 @@ def run(conv_id: str):
 
     # Reset K2 timer so the animation plays from the start
     try:
-        requests.post(f"{API}/conversations/{conv_id}/reset-k2-timer", timeout=3)
+        CLIENT.post(f"/conversations/{conv_id}/reset-k2-timer", timeout=3)
         print("  [K2 Timer Reset] Animation ready.\n")
     except Exception:
         pass
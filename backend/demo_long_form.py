@@ -10,7 +10,7 @@ Demonstrates:
 """
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.models import CommitmentGraph, Turn
 from app.analyzer import analyze_turn_hybrid_escalation
 from app.drift_accumulation import get_drift_summary
@@ -56,6 +56,9 @@ async def run_demo():
     # Initialize graph
     graph = CommitmentGraph(conversation_id="demo_longform")
 
+    # One clock read; turns are offset by 1 ms each to stay strictly ordered
+    base_ts = datetime.now()
+
     # Process each turn
     for turn_id, (speaker, text) in enumerate(DEMO_TURNS, start=1):
         print(f"\n{'─' * 80}")
@@ -68,7 +71,7 @@ async def run_demo():
             id=turn_id,
             speaker=speaker,
             text=text,
-            ts=datetime.now()
+            ts=base_ts + timedelta(milliseconds=turn_id)
         )
 
         # Add to graph
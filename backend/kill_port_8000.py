@@ -2,43 +2,56 @@
 import subprocess
 import sys
 
-# Find process using port 8000
-result = subprocess.run(
-    ['netstat', '-ano'],
-    capture_output=True,
-    text=True
-)
-
-for line in result.stdout.split('\n'):
-    if ':8000' in line and 'LISTENING' in line:
-        parts = line.split()
-        pid = parts[-1]
-        print(f"Found process {pid} on port 8000")
-
-        # Try to kill it
-        kill_result = subprocess.run(
-            ['taskkill', '/PID', pid, '/F'],
-            capture_output=True,
-            text=True
-        )
-        print(kill_result.stdout)
-        print(kill_result.stderr)
-
-        if kill_result.returncode == 0:
-            print("Successfully killed process")
-            sys.exit(0)
-        else:
-            # Try Python's psutil if available
-            try:
-                import psutil
-                p = psutil.Process(int(pid))
+PORT = 8000
+
+# Prefer psutil: reads the socket table directly, no netstat subprocess
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+if psutil is not None:
+    try:
+        for conn in psutil.net_connections(kind='tcp'):
+            if conn.laddr and conn.laddr.port == PORT and conn.status == psutil.CONN_LISTEN and conn.pid:
+                print(f"Found process {conn.pid} on port {PORT}")
+                p = psutil.Process(conn.pid)
                 p.terminate()
                 p.wait(timeout=5)
-                print(f"Killed process {pid} using psutil")
+                print(f"Killed process {conn.pid} using psutil")
+                sys.exit(0)
+    except Exception as e:
+        # e.g. AccessDenied listing sockets without root on macOS
+        print(f"Error with psutil: {e}")
+
+# Fallback (no psutil, or psutil failed): find process using port 8000
+try:
+    result = subprocess.run(
+        ['netstat', '-ano'],
+        capture_output=True,
+        text=True
+    )
+
+    for line in result.stdout.splitlines():
+        if f':{PORT}' in line and 'LISTENING' in line:
+            parts = line.split()
+            pid = parts[-1]
+            print(f"Found process {pid} on port {PORT}")
+
+            # Try to kill it
+            kill_result = subprocess.run(
+                ['taskkill', '/PID', pid, '/F'],
+                capture_output=True,
+                text=True
+            )
+            print(kill_result.stdout)
+            print(kill_result.stderr)
+
+            if kill_result.returncode == 0:
+                print("Successfully killed process")
                 sys.exit(0)
-            except ImportError:
-                print("psutil not available")
-            except Exception as e:
-                print(f"Error with psutil: {e}")
+except OSError as e:
+    # netstat/taskkill missing (non-Windows)
+    print(f"Error with netstat/taskkill: {e}")
 
 print("Could not kill process. Please close it manually.")
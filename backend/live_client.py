@@ -0,0 +1,56 @@
+"""
+Shared HTTP setup for the scripts that drive a running backend.
+
+Only failed connects are retried (nothing was sent yet); a POST that
+reached the server is never replayed.
+"""
+
+import atexit
+from datetime import datetime
+
+import httpx
+
+API_BASE = "http://localhost:8000"
+
+TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+
+# Batches analyze many turns per request: long read, same short connect
+BATCH_TIMEOUT = httpx.Timeout(60.0, connect=2.0)
+
+LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=50)
+
+
+def make_client() -> httpx.Client:
+    """Pooled client for API_BASE, closed when the script exits."""
+    client = httpx.Client(
+        base_url=API_BASE,
+        timeout=TIMEOUT,
+        transport=httpx.HTTPTransport(retries=2, limits=LIMITS),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def make_async_client() -> httpx.AsyncClient:
+    """Pooled async client for API_BASE; use it with `async with`."""
+    return httpx.AsyncClient(
+        base_url=API_BASE,
+        timeout=TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(retries=2, limits=LIMITS),
+    )
+
+
+def batch_payload(conversation_id: str, turns) -> dict:
+    """
+    Build an /analyze-turns-batch body from (speaker, text) pairs.
+
+    Turns are numbered from 1 and share one timestamp.
+    """
+    now_iso = datetime.now().isoformat()
+    return {
+        "conversation_id": conversation_id,
+        "turns": [
+            {"id": turn_id, "speaker": speaker, "text": text, "ts": now_iso}
+            for turn_id, (speaker, text) in enumerate(turns, start=1)
+        ]
+    }
@@ -2,72 +2,62 @@
 Create ONE conversation with MANY contradictions to build up drift score.
 """
 
-import requests
-from datetime import datetime
+from live_client import BATCH_TIMEOUT, batch_payload, make_client
+
+CLIENT = make_client()
+
+# Progressive contradictions on different topics
+TURNS = [
+    # Topic 1: Python (3 flips)
+    ("user", "Python is the best language ever created."),
+    ("model", "Python is indeed very popular."),
+    ("user", "Actually, I disagree completely. Python is terrible."),
+    ("model", "That's quite a change of opinion."),
+    ("user", "Yes, Python is absolutely the worst language."),
+    ("model", "Can you explain what changed?"),
+
+    # Topic 2: JavaScript (3 flips)
+    ("user", "JavaScript is excellent for modern web development."),
+    ("model", "JavaScript has evolved significantly."),
+    ("user", "No wait, JavaScript is completely broken and unusable."),
+    ("model", "That seems contradictory to what you just said."),
+    ("user", "JavaScript is the worst thing that ever happened to the web."),
+    ("model", "You seem to have very strong shifting opinions."),
+
+    # Topic 3: Databases (2 flips)
+    ("user", "SQL databases are clearly superior to NoSQL."),
+    ("model", "SQL has its strengths."),
+    ("user", "Actually SQL is outdated garbage. NoSQL is far better."),
+    ("model", "Your stance keeps changing."),
+]
 
-API_BASE = "http://localhost:8000"
 
 def create_accumulating_drift():
     """Create one conversation with escalating contradictions."""
 
     conversation_id = "visual-test-drift"
 
-    # Progressive contradictions on different topics
-    turns = [
-        # Topic 1: Python (3 flips)
-        ("user", "Python is the best language ever created."),
-        ("model", "Python is indeed very popular."),
-        ("user", "Actually, I disagree completely. Python is terrible."),
-        ("model", "That's quite a change of opinion."),
-        ("user", "Yes, Python is absolutely the worst language."),
-        ("model", "Can you explain what changed?"),
-
-        # Topic 2: JavaScript (3 flips)
-        ("user", "JavaScript is excellent for modern web development."),
-        ("model", "JavaScript has evolved significantly."),
-        ("user", "No wait, JavaScript is completely broken and unusable."),
-        ("model", "That seems contradictory to what you just said."),
-        ("user", "JavaScript is the worst thing that ever happened to the web."),
-        ("model", "You seem to have very strong shifting opinions."),
-
-        # Topic 3: Databases (2 flips)
-        ("user", "SQL databases are clearly superior to NoSQL."),
-        ("model", "SQL has its strengths."),
-        ("user", "Actually SQL is outdated garbage. NoSQL is far better."),
-        ("model", "Your stance keeps changing."),
-    ]
-
     print(f"Creating conversation: {conversation_id}")
     print("=" * 60)
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text[:50]}")
+    payload = batch_payload(conversation_id, TURNS)
 
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> {len(alerts)} alerts: {alerts[0]['severity'].upper()}")
-                else:
-                    print(f"  -> OK")
-            else:
-                print(f"  -> ERROR {response.status_code}")
+    try:
+        response = CLIENT.post("/analyze-turns-batch", json=payload, timeout=BATCH_TIMEOUT)
+        response.raise_for_status()
+        results = response.json()["results"]
+    except Exception as e:
+        print(f"  -> ERROR: {e}")
+        results = []
+
+    for turn_id, ((speaker, text), result) in enumerate(zip(TURNS, results), start=1):
+        print(f"\nTurn {turn_id}: {text[:50]}")
 
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+        alerts = result.get("alerts", [])
+        if alerts:
+            print(f"  -> {len(alerts)} alerts: {alerts[0]['severity'].upper()}")
+        else:
+            print(f"  -> OK")
 
     # Get final metrics
     print("\n" + "=" * 60)
@@ -75,8 +65,8 @@ def create_accumulating_drift():
     print("=" * 60)
 
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = CLIENT.get(f"/conversations/{conversation_id}/metrics")
+        if response.is_success:
             metrics = response.json()
             drift = metrics.get('drift', {})
 
@@ -12,81 +12,96 @@ Target: Generate escalation-level drift (score > 2.0)
 """
 
 import sys
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 API_BASE = "http://localhost:8000"
 
+# One pooled session for the whole run: every turn reuses the same connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=16))
+atexit.register(SESSION.close)
+
+# High-overlap contradictions for maximum drift detection
+DEMO_TURNS = (
+    # Topic 1: AI capabilities (strong contradictions)
+    ("user", "AI models are excellent tools for creative writing."),
+    ("model", "AI can assist with brainstorming and drafting."),
+    ("user", "AI models are not excellent tools for creative writing."),
+    ("model", "What changed your perspective?"),
+    ("user", "AI models are terrible tools for creative writing."),
+    ("model", "I see you've reconsidered."),
+
+    # Topic 2: Code quality (escalating drift)
+    ("user", "TypeScript is a good choice for large projects."),
+    ("model", "TypeScript provides type safety benefits."),
+    ("user", "TypeScript is not a good choice for large projects."),
+    ("model", "That's quite a shift in opinion."),
+    ("user", "TypeScript is a bad choice for large projects."),
+    ("model", "Can you explain what led to this change?"),
+
+    # Topic 3: Testing practices (more contradictions)
+    ("user", "Unit testing is essential for production code."),
+    ("model", "Unit tests help catch bugs early."),
+    ("user", "Unit testing is not essential for production code."),
+    ("model", "Your stance has changed."),
+    ("user", "Unit testing is harmful for production code."),
+    ("model", "That's a significant reversal."),
+
+    # Topic 4: Architecture decisions (push over threshold)
+    ("user", "Microservices are better than monoliths for scalability."),
+    ("model", "Microservices offer independent scaling."),
+    ("user", "Microservices are not better than monoliths for scalability."),
+    ("model", "What made you reconsider?"),
+    ("user", "Microservices are worse than monoliths for scalability."),
+    ("model", "I notice you've changed your view again."),
+)
+
+# Static part of each turn payload, built once; only "ts" varies per run
+TURN_BODIES = [
+    {"id": turn_id, "speaker": speaker, "text": text}
+    for turn_id, (speaker, text) in enumerate(DEMO_TURNS, start=1)
+]
+
+
 def create_demo_drift(conversation_id: str):
     """Create drift data for the given conversation."""
 
-    # High-overlap contradictions for maximum drift detection
-    turns = [
-        # Topic 1: AI capabilities (strong contradictions)
-        ("user", "AI models are excellent tools for creative writing."),
-        ("model", "AI can assist with brainstorming and drafting."),
-        ("user", "AI models are not excellent tools for creative writing."),
-        ("model", "What changed your perspective?"),
-        ("user", "AI models are terrible tools for creative writing."),
-        ("model", "I see you've reconsidered."),
-
-        # Topic 2: Code quality (escalating drift)
-        ("user", "TypeScript is a good choice for large projects."),
-        ("model", "TypeScript provides type safety benefits."),
-        ("user", "TypeScript is not a good choice for large projects."),
-        ("model", "That's quite a shift in opinion."),
-        ("user", "TypeScript is a bad choice for large projects."),
-        ("model", "Can you explain what led to this change?"),
-
-        # Topic 3: Testing practices (more contradictions)
-        ("user", "Unit testing is essential for production code."),
-        ("model", "Unit tests help catch bugs early."),
-        ("user", "Unit testing is not essential for production code."),
-        ("model", "Your stance has changed."),
-        ("user", "Unit testing is harmful for production code."),
-        ("model", "That's a significant reversal."),
-
-        # Topic 4: Architecture decisions (push over threshold)
-        ("user", "Microservices are better than monoliths for scalability."),
-        ("model", "Microservices offer independent scaling."),
-        ("user", "Microservices are not better than monoliths for scalability."),
-        ("model", "What made you reconsider?"),
-        ("user", "Microservices are worse than monoliths for scalability."),
-        ("model", "I notice you've changed your view again."),
-    ]
-
     print(f"Creating drift data for demo conversation")
     print(f"Conversation ID: {conversation_id}")
     print("=" * 70)
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text[:60]}...")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> {len(alerts)} alert(s): {alerts[0]['severity'].upper()}")
-                else:
-                    print(f"  -> OK")
-            else:
-                print(f"  -> ERROR {response.status_code}")
+    now_iso = datetime.now().isoformat()
+    payload = {
+        "conversation_id": conversation_id,
+        "turns": [{**body, "ts": now_iso} for body in TURN_BODIES]
+    }
 
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+    results = []
+    try:
+        response = SESSION.post(f"{API_BASE}/analyze-turns-batch", json=payload, timeout=60)
+
+        if response.ok:
+            results = response.json()["results"]
+        else:
+            print(f"  -> ERROR {response.status_code}")
+
+    except Exception as e:
+        print(f"  -> ERROR: {e}")
+
+    lines = []
+    for turn_id, ((speaker, text), result) in enumerate(zip(DEMO_TURNS, results), start=1):
+        lines.append(f"\nTurn {turn_id}: {text[:60]}...")
+
+        alerts = result.get("alerts", [])
+        if alerts:
+            lines.append(f"  -> {len(alerts)} alert(s): {alerts[0]['severity'].upper()}")
+        else:
+            lines.append(f"  -> OK")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Get final metrics
     print("\n" + "=" * 70)
@@ -94,7 +109,7 @@ def create_demo_drift(conversation_id: str):
     print("=" * 70)
 
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
+        response = SESSION.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
         if response.ok:
             metrics = response.json()
             drift = metrics.get('drift', {})
@@ -134,16 +149,17 @@ if __name__ == "__main__":
 
     # Clear any existing data for fresh demo
     try:
-        requests.delete(f"http://localhost:8000/conversations/{conversation_id}", timeout=2)
+        # (connect, read): a stalled backend can't hold up the run
+        SESSION.delete(f"{API_BASE}/conversations/{conversation_id}", timeout=(1.0, 2.0))
         print("[Cleared previous conversation data]\n")
-    except:
-        pass
+    except requests.RequestException as e:
+        print(f"[Could not clear previous conversation data: {e}]\n")
 
     create_demo_drift(conversation_id)
 
     # Reset K2 timer so animation plays fresh when extension is opened
     try:
-        response = requests.post(f"http://localhost:8000/conversations/{conversation_id}/reset-k2-timer", timeout=2)
+        response = SESSION.post(f"{API_BASE}/conversations/{conversation_id}/reset-k2-timer", timeout=2)
         if response.ok:
             print("\n[K2 Timer Reset] Animation ready for demo recording")
         else:
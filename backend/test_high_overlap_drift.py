@@ -5,82 +5,98 @@ This works around the Jaccard similarity limitation by using
 statements that share many common words while still contradicting.
 """
 
+import atexit
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
 API_BASE = "http://localhost:8000"
 
+# One pooled session for the whole run: every turn reuses the same connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=16))
+atexit.register(SESSION.close)
+
+# Contradictions with MAXIMUM token overlap
+HIGH_OVERLAP_TURNS = (
+    # Python topic - same structure, opposite meaning
+    ("user", "Python is an excellent programming language for data science."),
+    ("model", "Python has excellent data science libraries."),
+    ("user", "Python is not an excellent programming language for data science."),
+    ("model", "What changed your view?"),
+    ("user", "Python is a terrible programming language for data science."),
+    ("model", "Can you explain more?"),
+
+    # JavaScript topic - repeat structure
+    ("user", "JavaScript is a good language for web development."),
+    ("model", "JavaScript has evolved significantly."),
+    ("user", "JavaScript is not a good language for web development."),
+    ("model", "That's a change in stance."),
+    ("user", "JavaScript is a bad language for web development."),
+    ("model", "What led to this conclusion?"),
+
+    # Databases - high overlap
+    ("user", "SQL databases are better than NoSQL databases for most applications."),
+    ("model", "SQL has strong consistency guarantees."),
+    ("user", "SQL databases are not better than NoSQL databases for most applications."),
+    ("model", "Your position has shifted."),
+    ("user", "SQL databases are worse than NoSQL databases for most applications."),
+    ("model", "I see you've reconsidered."),
+
+    # Typing - maximum overlap
+    ("user", "Static typing is good for large codebases."),
+    ("model", "Static typing provides compile-time safety."),
+    ("user", "Static typing is not good for large codebases."),
+    ("model", "Your opinion changed."),
+    ("user", "Static typing is bad for large codebases."),
+    ("model", "What caused this shift?"),
+)
+
+# Static part of each turn payload, built once; only "ts" varies per run
+TURN_BODIES = [
+    {"id": turn_id, "speaker": speaker, "text": text}
+    for turn_id, (speaker, text) in enumerate(HIGH_OVERLAP_TURNS, start=1)
+]
+
+
 def create_high_overlap_drift():
     """Create contradictions with high token overlap for Jaccard similarity."""
 
     conversation_id = "high-overlap-drift"
 
-    # Contradictions with MAXIMUM token overlap
-    turns = [
-        # Python topic - same structure, opposite meaning
-        ("user", "Python is an excellent programming language for data science."),
-        ("model", "Python has excellent data science libraries."),
-        ("user", "Python is not an excellent programming language for data science."),
-        ("model", "What changed your view?"),
-        ("user", "Python is a terrible programming language for data science."),
-        ("model", "Can you explain more?"),
-
-        # JavaScript topic - repeat structure
-        ("user", "JavaScript is a good language for web development."),
-        ("model", "JavaScript has evolved significantly."),
-        ("user", "JavaScript is not a good language for web development."),
-        ("model", "That's a change in stance."),
-        ("user", "JavaScript is a bad language for web development."),
-        ("model", "What led to this conclusion?"),
-
-        # Databases - high overlap
-        ("user", "SQL databases are better than NoSQL databases for most applications."),
-        ("model", "SQL has strong consistency guarantees."),
-        ("user", "SQL databases are not better than NoSQL databases for most applications."),
-        ("model", "Your position has shifted."),
-        ("user", "SQL databases are worse than NoSQL databases for most applications."),
-        ("model", "I see you've reconsidered."),
-
-        # Typing - maximum overlap
-        ("user", "Static typing is good for large codebases."),
-        ("model", "Static typing provides compile-time safety."),
-        ("user", "Static typing is not good for large codebases."),
-        ("model", "Your opinion changed."),
-        ("user", "Static typing is bad for large codebases."),
-        ("model", "What caused this shift?"),
-    ]
-
     print(f"Creating conversation: {conversation_id}")
     print("=" * 60)
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text[:55]}...")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> {len(alerts)} alert(s): {alerts[0]['severity'].upper()}")
-                else:
-                    print(f"  -> OK")
-            else:
-                print(f"  -> ERROR {response.status_code}")
+    now_iso = datetime.now().isoformat()
+    payload = {
+        "conversation_id": conversation_id,
+        "turns": [{**body, "ts": now_iso} for body in TURN_BODIES]
+    }
 
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+    results = []
+    try:
+        response = SESSION.post(f"{API_BASE}/analyze-turns-batch", json=payload, timeout=60)
+
+        if response.ok:
+            results = response.json()["results"]
+        else:
+            print(f"  -> ERROR {response.status_code}")
+
+    except Exception as e:
+        print(f"  -> ERROR: {e}")
+
+    lines = []
+    for turn_id, ((speaker, text), result) in enumerate(zip(HIGH_OVERLAP_TURNS, results), start=1):
+        lines.append(f"\nTurn {turn_id}: {text[:55]}...")
+
+        alerts = result.get("alerts", [])
+        if alerts:
+            lines.append(f"  -> {len(alerts)} alert(s): {alerts[0]['severity'].upper()}")
+        else:
+            lines.append(f"  -> OK")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Get final metrics
     print("\n" + "=" * 60)
@@ -88,7 +104,7 @@ def create_high_overlap_drift():
     print("=" * 60)
 
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
+        response = SESSION.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
         if response.ok:
             metrics = response.json()
             drift = metrics.get('drift', {})
@@ -4,11 +4,25 @@ Quick test script to populate backend with drift data.
 Run this to create a conversation with drift events so you can test the visualization.
 """
 
-import requests
 import json
-from datetime import datetime
+import sys
 
-API_BASE = "http://localhost:8000"
+from live_client import BATCH_TIMEOUT, batch_payload, make_client
+
+# Only the metrics printed in the summary are requested from the server
+METRIC_FIELDS = ",".join([
+    "drift.cumulative_drift_score",
+    "drift.drift_velocity",
+    "drift.total_drift_events",
+    "drift.is_recovering",
+    "commitments.total",
+    "commitments.active",
+    "contradictions.count",
+    "escalation.total_escalations",
+    "escalation.escalation_rate",
+])
+
+CLIENT = make_client()
 
 def create_conversation_with_drift():
     """Create a test conversation with gradual drift."""
@@ -32,40 +46,33 @@ def create_conversation_with_drift():
     print(f"Creating conversation: {conversation_id}")
     print("=" * 60)
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id} ({speaker}): {text[:50]}...")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(
-                f"{API_BASE}/analyze-turn",
-                json=payload,
-                timeout=10
-            )
-
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                print(f"  [OK] Analyzed - {len(alerts)} alerts")
-
-                if alerts:
-                    for alert in alerts:
-                        print(f"    - {alert['severity'].upper()}: {alert['alert_type']}")
-            else:
-                print(f"  [ERROR] Status: {response.status_code}")
-                print(f"    {response.text}")
-
-        except Exception as e:
-            print(f"  [ERROR] Failed: {e}")
+    payload = batch_payload(conversation_id, turns)
+
+    results = []
+    try:
+        response = CLIENT.post("/analyze-turns-batch", json=payload, timeout=BATCH_TIMEOUT)
+
+        if response.is_success:
+            results = response.json()["results"]
+        else:
+            print(f"  [ERROR] Status: {response.status_code}")
+            print(f"    {response.text}")
+
+    except Exception as e:
+        print(f"  [ERROR] Failed: {e}")
+
+    lines = []
+    for turn_id, ((speaker, text), result) in enumerate(zip(turns, results), start=1):
+        lines.append(f"\nTurn {turn_id} ({speaker}): {text[:50]}...")
+
+        alerts = result.get("alerts", [])
+        lines.append(f"  [OK] Analyzed - {len(alerts)} alerts")
+
+        if alerts:
+            for alert in alerts:
+                lines.append(f"    - {alert['severity'].upper()}: {alert['alert_type']}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Get final metrics
     print("\n" + "=" * 60)
@@ -73,8 +80,8 @@ def create_conversation_with_drift():
     print("=" * 60)
 
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = CLIENT.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+        if response.is_success:
             metrics = response.json()
 
             print(f"\n[DRIFT] Metrics:")
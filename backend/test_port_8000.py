@@ -1,7 +1,10 @@
 """Test contradiction edges on port 8000"""
-import requests
+from live_client import make_client
 
-API_BASE = "http://localhost:8000"
+# Only the metrics printed in the summary are requested from the server
+METRIC_FIELDS = "contradictions.count,alerts.total"
+
+CLIENT = make_client()
 
 # Simple test with 3 turns that should create contradiction edges
 conversation_id = "test-port-8000-contradictions"
@@ -16,7 +19,7 @@ print("Testing contradiction edge creation on port 8000...\n")
 
 # Clear any existing data
 try:
-    requests.delete(f"{API_BASE}/conversations/{conversation_id}")
+    CLIENT.delete(f"/conversations/{conversation_id}")
 except:
     pass
 
@@ -32,9 +35,9 @@ for turn_id, (speaker, text) in enumerate(turns, start=1):
     }
 
     print(f"Turn {turn_id}: {text[:50]}...")
-    response = requests.post(f"{API_BASE}/analyze-turn", json=payload)
+    response = CLIENT.post("/analyze-turn", json=payload)
 
-    if response.ok:
+    if response.is_success:
         data = response.json()
         alerts = data.get("alerts", [])
         if alerts:
@@ -46,8 +49,8 @@ for turn_id, (speaker, text) in enumerate(turns, start=1):
 
 # Get final metrics
 print("\n" + "=" * 60)
-response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-if response.ok:
+response = CLIENT.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+if response.is_success:
     metrics = response.json()
     print(f"Contradictions: {metrics['contradictions']['count']}")
     print(f"Total Alerts: {metrics['alerts']['total']}")
@@ -55,8 +58,8 @@ else:
     print(f"ERROR getting metrics: {response.status_code}")
 
 # Get full conversation to check edges
-response = requests.get(f"{API_BASE}/conversations/{conversation_id}")
-if response.ok:
+response = CLIENT.get(f"/conversations/{conversation_id}")
+if response.is_success:
     data = response.json()
     edges = data.get("edges", [])
     contradiction_edges = [e for e in edges if e.get("relation") == "contradicts"]
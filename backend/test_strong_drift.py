@@ -2,10 +2,14 @@
 Create a conversation with STRONG contradictions to trigger drift detection.
 """
 
-import requests
-from datetime import datetime
+import sys
 
-API_BASE = "http://localhost:8000"
+from live_client import BATCH_TIMEOUT, batch_payload, make_client
+
+# Only the metrics printed in the summary are requested from the server
+METRIC_FIELDS = "drift.cumulative_drift_score,drift.total_drift_events,contradictions.count"
+
+CLIENT = make_client()
 
 def create_strong_contradiction():
     """Create obvious contradictions."""
@@ -25,41 +29,38 @@ def create_strong_contradiction():
     print(f"Creating conversation: {conversation_id}")
     print("=" * 60)
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id} ({speaker}): {text}")
+    payload = batch_payload(conversation_id, turns)
+
+    results = []
+    try:
+        response = CLIENT.post("/analyze-turns-batch", json=payload, timeout=BATCH_TIMEOUT)
 
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
+        if response.is_success:
+            results = response.json()["results"]
+        else:
+            print(f"  [ERROR] {response.status_code}")
 
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
+    except Exception as e:
+        print(f"  [ERROR] {e}")
 
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                print(f"  [OK] {len(alerts)} alerts")
+    lines = []
+    for turn_id, ((speaker, text), result) in enumerate(zip(turns, results), start=1):
+        lines.append(f"\nTurn {turn_id} ({speaker}): {text}")
 
-                if alerts:
-                    for alert in alerts:
-                        print(f"    - {alert['severity'].upper()}: {alert['message'][:60]}")
-            else:
-                print(f"  [ERROR] {response.status_code}")
+        alerts = result.get("alerts", [])
+        lines.append(f"  [OK] {len(alerts)} alerts")
 
-        except Exception as e:
-            print(f"  [ERROR] {e}")
+        if alerts:
+            for alert in alerts:
+                lines.append(f"    - {alert['severity'].upper()}: {alert['message'][:60]}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Get metrics
     print("\n" + "=" * 60)
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = CLIENT.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+        if response.is_success:
             metrics = response.json()
             drift = metrics.get('drift', {})
             print(f"\nDrift Score: {drift.get('cumulative_drift_score', 0):.3f}")
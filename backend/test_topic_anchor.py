@@ -5,12 +5,36 @@ This test validates that contradictions are detected based on
 TOPIC MATCH rather than token overlap.
 """
 
-import requests
-from datetime import datetime
+import asyncio
+import io
+import sys
+import httpx
 
-API_BASE = "http://localhost:8000"
+from live_client import BATCH_TIMEOUT, batch_payload, make_async_client
 
-def test_case_1_same_anchor_opposite_polarity():
+# Only the metrics the cases print are requested from the server
+METRIC_FIELDS = "drift.cumulative_drift_score,drift.total_drift_events,drift.drift_velocity"
+
+
+async def run_turns(client: httpx.AsyncClient, conversation_id: str, turns, out) -> list:
+    """
+    Submit a case's turns in one batch request and return the per-turn results.
+
+    Every turn shares one timestamp; the server analyzes them in order.
+    Errors are reported to out and yield an empty result list.
+    """
+    payload = batch_payload(conversation_id, turns)
+
+    try:
+        response = await client.post("/analyze-turns-batch", json=payload, timeout=BATCH_TIMEOUT)
+        if response.is_success:
+            return response.json()["results"]
+    except Exception as e:
+        print(f"  -> ERROR: {e}", file=out)
+    return []
+
+
+async def run_case_1_same_anchor_opposite_polarity(client: httpx.AsyncClient) -> str:
     """
     Case 1: Same topic anchor, opposite polarity
 
@@ -19,9 +43,10 @@ def test_case_1_same_anchor_opposite_polarity():
     - "Python is terrible" → topic_anchor="python", polarity=negative
     - Anchor match + polarity diff → contradiction
     """
-    print("\n" + "=" * 70)
-    print("TEST CASE 1: Same Anchor, Opposite Polarity")
-    print("=" * 70)
+    out = io.StringIO()
+    print("\n" + "=" * 70, file=out)
+    print("TEST CASE 1: Same Anchor, Opposite Polarity", file=out)
+    print("=" * 70, file=out)
 
     conversation_id = "test-anchor-case1"
 
@@ -32,52 +57,40 @@ def test_case_1_same_anchor_opposite_polarity():
         ("model", "What changed your view?"),
     ]
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text}")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> DETECTED: {len(alerts)} alert(s)")
-                    for alert in alerts:
-                        print(f"     {alert['severity'].upper()}: {alert['message'][:80]}")
-                else:
-                    print(f"  -> OK (no alerts)")
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+    results = await run_turns(client, conversation_id, turns, out)
+
+    for turn_id, ((speaker, text), result) in enumerate(zip(turns, results), start=1):
+        print(f"\nTurn {turn_id}: {text}", file=out)
+
+        alerts = result.get("alerts", [])
+        if alerts:
+            print(f"  -> DETECTED: {len(alerts)} alert(s)", file=out)
+            for alert in alerts:
+                print(f"     {alert['severity'].upper()}: {alert['message'][:80]}", file=out)
+        else:
+            print(f"  -> OK (no alerts)", file=out)
 
     # Get metrics
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = await client.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+        if response.is_success:
             metrics = response.json()
             drift = metrics.get('drift', {})
-            print(f"\n[RESULT]")
-            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}")
-            print(f"  Drift Events: {drift.get('total_drift_events', 0)}")
+            print(f"\n[RESULT]", file=out)
+            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}", file=out)
+            print(f"  Drift Events: {drift.get('total_drift_events', 0)}", file=out)
 
             if drift.get('total_drift_events', 0) > 0:
-                print("  ✓ PASS: Contradiction detected via topic anchor")
+                print("  ✓ PASS: Contradiction detected via topic anchor", file=out)
             else:
-                print("  ✗ FAIL: Should have detected contradiction")
+                print("  ✗ FAIL: Should have detected contradiction", file=out)
     except Exception as e:
-        print(f"  ERROR: {e}")
+        print(f"  ERROR: {e}", file=out)
+
+    return out.getvalue()
 
 
-def test_case_2_different_anchors():
+async def run_case_2_different_anchors(client: httpx.AsyncClient) -> str:
     """
     Case 2: Different topic anchors
 
@@ -86,9 +99,10 @@ def test_case_2_different_anchors():
     - "Monoliths are better" → topic_anchor="monoliths"
     - Different anchors → no contradiction
     """
-    print("\n" + "=" * 70)
-    print("TEST CASE 2: Different Anchors (No Contradiction)")
-    print("=" * 70)
+    out = io.StringIO()
+    print("\n" + "=" * 70, file=out)
+    print("TEST CASE 2: Different Anchors (No Contradiction)", file=out)
+    print("=" * 70, file=out)
 
     conversation_id = "test-anchor-case2"
 
@@ -99,50 +113,38 @@ def test_case_2_different_anchors():
         ("model", "That's a different trade-off."),
     ]
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text}")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> DETECTED: {len(alerts)} alert(s)")
-                else:
-                    print(f"  -> OK (no alerts)")
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+    results = await run_turns(client, conversation_id, turns, out)
+
+    for turn_id, ((speaker, text), result) in enumerate(zip(turns, results), start=1):
+        print(f"\nTurn {turn_id}: {text}", file=out)
+
+        alerts = result.get("alerts", [])
+        if alerts:
+            print(f"  -> DETECTED: {len(alerts)} alert(s)", file=out)
+        else:
+            print(f"  -> OK (no alerts)", file=out)
 
     # Get metrics
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = await client.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+        if response.is_success:
             metrics = response.json()
             drift = metrics.get('drift', {})
-            print(f"\n[RESULT]")
-            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}")
-            print(f"  Drift Events: {drift.get('total_drift_events', 0)}")
+            print(f"\n[RESULT]", file=out)
+            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}", file=out)
+            print(f"  Drift Events: {drift.get('total_drift_events', 0)}", file=out)
 
             if drift.get('total_drift_events', 0) == 0:
-                print("  ✓ PASS: No false positive (different topics)")
+                print("  ✓ PASS: No false positive (different topics)", file=out)
             else:
-                print("  ✗ FAIL: Should NOT detect contradiction (different topics)")
+                print("  ✗ FAIL: Should NOT detect contradiction (different topics)", file=out)
     except Exception as e:
-        print(f"  ERROR: {e}")
+        print(f"  ERROR: {e}", file=out)
 
+    return out.getvalue()
 
-def test_case_3_low_token_overlap():
+
+async def run_case_3_low_token_overlap(client: httpx.AsyncClient) -> str:
     """
     Case 3: Same topic, low token overlap
 
@@ -151,9 +153,10 @@ def test_case_3_low_token_overlap():
     - "I avoid static typing" → topic_anchor="typescript" (inferred)
     - Low Jaccard similarity but same anchor → detect
     """
-    print("\n" + "=" * 70)
-    print("TEST CASE 3: Low Token Overlap, Same Topic")
-    print("=" * 70)
+    out = io.StringIO()
+    print("\n" + "=" * 70, file=out)
+    print("TEST CASE 3: Low Token Overlap, Same Topic", file=out)
+    print("=" * 70, file=out)
 
     conversation_id = "test-anchor-case3"
 
@@ -164,60 +167,49 @@ def test_case_3_low_token_overlap():
         ("model", "What's your concern?"),
     ]
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text}")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> DETECTED: {len(alerts)} alert(s)")
-                    for alert in alerts:
-                        print(f"     {alert['severity'].upper()}: {alert['message'][:80]}")
-                else:
-                    print(f"  -> OK (no alerts)")
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+    results = await run_turns(client, conversation_id, turns, out)
+
+    for turn_id, ((speaker, text), result) in enumerate(zip(turns, results), start=1):
+        print(f"\nTurn {turn_id}: {text}", file=out)
+
+        alerts = result.get("alerts", [])
+        if alerts:
+            print(f"  -> DETECTED: {len(alerts)} alert(s)", file=out)
+            for alert in alerts:
+                print(f"     {alert['severity'].upper()}: {alert['message'][:80]}", file=out)
+        else:
+            print(f"  -> OK (no alerts)", file=out)
 
     # Get metrics
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = await client.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+        if response.is_success:
             metrics = response.json()
             drift = metrics.get('drift', {})
-            print(f"\n[RESULT]")
-            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}")
-            print(f"  Drift Events: {drift.get('total_drift_events', 0)}")
+            print(f"\n[RESULT]", file=out)
+            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}", file=out)
+            print(f"  Drift Events: {drift.get('total_drift_events', 0)}", file=out)
 
             if drift.get('total_drift_events', 0) > 0:
-                print("  ✓ PASS: Detected despite low token overlap")
+                print("  ✓ PASS: Detected despite low token overlap", file=out)
             else:
-                print("  ✗ FAIL: Should have detected (same topic)")
+                print("  ✗ FAIL: Should have detected (same topic)", file=out)
     except Exception as e:
-        print(f"  ERROR: {e}")
+        print(f"  ERROR: {e}", file=out)
+
+    return out.getvalue()
 
 
-def test_case_4_long_conversation():
+async def run_case_4_long_conversation(client: httpx.AsyncClient) -> str:
     """
     Case 4: Long conversation with gradual drift
 
     Expected: Accumulate drift over multiple turns
     """
-    print("\n" + "=" * 70)
-    print("TEST CASE 4: Long Conversation with Accumulation")
-    print("=" * 70)
+    out = io.StringIO()
+    print("\n" + "=" * 70, file=out)
+    print("TEST CASE 4: Long Conversation with Accumulation", file=out)
+    print("=" * 70, file=out)
 
     conversation_id = "test-anchor-case4"
 
@@ -236,48 +228,51 @@ def test_case_4_long_conversation():
         ("model", "What alternative do you prefer?"),
     ]
 
-    for turn_id, (speaker, text) in enumerate(turns, start=1):
-        print(f"\nTurn {turn_id}: {text[:50]}...")
-
-        payload = {
-            "conversation_id": conversation_id,
-            "new_turn": {
-                "id": turn_id,
-                "speaker": speaker,
-                "text": text,
-                "ts": datetime.now().isoformat()
-            }
-        }
-
-        try:
-            response = requests.post(f"{API_BASE}/analyze-turn", json=payload, timeout=10)
-            if response.ok:
-                data = response.json()
-                alerts = data.get("alerts", [])
-                if alerts:
-                    print(f"  -> {len(alerts)} alert(s)")
-                else:
-                    print(f"  -> OK")
-        except Exception as e:
-            print(f"  -> ERROR: {e}")
+    results = await run_turns(client, conversation_id, turns, out)
+
+    for turn_id, ((speaker, text), result) in enumerate(zip(turns, results), start=1):
+        print(f"\nTurn {turn_id}: {text[:50]}...", file=out)
+
+        alerts = result.get("alerts", [])
+        if alerts:
+            print(f"  -> {len(alerts)} alert(s)", file=out)
+        else:
+            print(f"  -> OK", file=out)
 
     # Get metrics
     try:
-        response = requests.get(f"{API_BASE}/conversations/{conversation_id}/metrics")
-        if response.ok:
+        response = await client.get(f"/conversations/{conversation_id}/metrics", params={"fields": METRIC_FIELDS})
+        if response.is_success:
             metrics = response.json()
             drift = metrics.get('drift', {})
-            print(f"\n[RESULT]")
-            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}")
-            print(f"  Drift Events: {drift.get('total_drift_events', 0)}")
-            print(f"  Drift Velocity: {drift.get('drift_velocity', 0):.3f}")
+            print(f"\n[RESULT]", file=out)
+            print(f"  Drift Score: {drift.get('cumulative_drift_score', 0):.3f}", file=out)
+            print(f"  Drift Events: {drift.get('total_drift_events', 0)}", file=out)
+            print(f"  Drift Velocity: {drift.get('drift_velocity', 0):.3f}", file=out)
 
             if drift.get('cumulative_drift_score', 0) > 1.0:
-                print("  ✓ PASS: Drift accumulated over conversation")
+                print("  ✓ PASS: Drift accumulated over conversation", file=out)
             else:
-                print("  ⚠ Note: Drift score lower than expected")
+                print("  ⚠ Note: Drift score lower than expected", file=out)
     except Exception as e:
-        print(f"  ERROR: {e}")
+        print(f"  ERROR: {e}", file=out)
+
+    return out.getvalue()
+
+
+async def main():
+    """Run the four cases concurrently; each uses its own conversation."""
+    async with make_async_client() as client:
+        # Turns within a case stay sequential; only the cases overlap.
+        # Each case buffers its report so output stays in case order.
+        reports = await asyncio.gather(
+            run_case_1_same_anchor_opposite_polarity(client),
+            run_case_2_different_anchors(client),
+            run_case_3_low_token_overlap(client),
+            run_case_4_long_conversation(client),
+        )
+
+    sys.stdout.write("".join(reports))
 
 
 if __name__ == "__main__":
@@ -285,10 +280,7 @@ if __name__ == "__main__":
     print("TOPIC-ANCHOR BASED CONTRADICTION DETECTION TESTS")
     print("=" * 70)
 
-    test_case_1_same_anchor_opposite_polarity()
-    test_case_2_different_anchors()
-    test_case_3_low_token_overlap()
-    test_case_4_long_conversation()
+    asyncio.run(main())
 
     print("\n" + "=" * 70)
     print("ALL TESTS COMPLETE")
@@ -0,0 +1,230 @@
+"""Tests for the HTTP endpoints."""
+
+import asyncio
+import json
+from collections import OrderedDict
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app import analyzer, main
+
+TS = "2025-01-01T00:00:00"
+
+# Turns 3 and 5 escalate to async K2; the last two turns do not
+ESCALATING_TURNS = [
+    ("user", "Python is great for building services."),
+    ("model", "Python is popular."),
+    ("user", "Python is not great for building services."),
+    ("model", "Noted."),
+    ("user", "Python is terrible for building services."),
+    ("model", "Rust is great for building services."),
+    ("user", "Rust is popular."),
+]
+
+# Wall-clock fields that differ between two otherwise identical runs
+VOLATILE_KEYS = {"timestamp", "created_at", "last_k2_update"}
+
+
+def _turn(turn_id, speaker, text):
+    return {"id": turn_id, "speaker": speaker, "text": text, "ts": TS}
+
+
+def _strip_volatile(value):
+    """Drop wall-clock fields so two graphs can be compared."""
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Empty session store, with K2 disabled."""
+    monkeypatch.setattr(main, "conversation_graphs", OrderedDict())
+    monkeypatch.setattr(analyzer.k2_client, "api_key", None)
+
+
+@pytest.fixture
+def client(store):
+    """Client against the empty session store."""
+    return TestClient(main.app)
+
+
+def test_batch_matches_sequential(client):
+    """Test a batch leaves the same graph as posting each turn in turn."""
+    turns = [_turn(i, speaker, text) for i, (speaker, text) in enumerate(ESCALATING_TURNS, start=1)]
+
+    for turn in turns:
+        response = client.post("/analyze-turn", json={"conversation_id": "conv", "new_turn": turn})
+        assert response.status_code == 200
+    sequential = client.get("/conversations/conv").json()
+    client.delete("/conversations/conv")
+
+    response = client.post("/analyze-turns-batch", json={"conversation_id": "conv", "turns": turns})
+    assert response.status_code == 200
+    batch = client.get("/conversations/conv").json()
+
+    # Async K2 ran to completion in both cases
+    assert sequential["metadata"]["k2_processing_pending"] is False
+    assert batch["metadata"]["k2_processing_complete"] is True
+    assert _strip_volatile(batch) == _strip_volatile(sequential)
+
+
+def test_conversation_store_evicts_least_recent(client, monkeypatch):
+    """Test the session store drops the least recently used conversation."""
+    monkeypatch.setattr(main, "MAX_CONVERSATIONS", 2)
+    monkeypatch.setattr(main, "evicted_conversations", 0)
+
+    for conversation_id in ["a", "b", "a", "c"]:
+        client.post("/analyze-turn", json={
+            "conversation_id": conversation_id,
+            "new_turn": _turn(1, "user", "Python is great.")
+        })
+
+    assert list(main.conversation_graphs) == ["a", "c"]
+    assert client.get("/").json()["evicted_conversations"] == 1
+
+
+def test_conversation_store_reads_refresh_recency(client, monkeypatch):
+    """Test reading a conversation keeps it from being evicted next."""
+    monkeypatch.setattr(main, "MAX_CONVERSATIONS", 2)
+
+    for conversation_id in ["a", "b"]:
+        client.post("/analyze-turn", json={
+            "conversation_id": conversation_id,
+            "new_turn": _turn(1, "user", "Python is great.")
+        })
+    client.get("/conversations/a/metrics")
+    client.post("/analyze-turn", json={"conversation_id": "c", "new_turn": _turn(1, "user", "Python is great.")})
+
+    assert list(main.conversation_graphs) == ["a", "c"]
+
+
+def test_metrics_not_modified(client):
+    """Test a matching If-None-Match gets an empty 304."""
+    client.post("/analyze-turn", json={"conversation_id": "conv", "new_turn": _turn(1, "user", "Python is great.")})
+
+    first = client.get("/conversations/conv/metrics")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = client.get("/conversations/conv/metrics", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+    # A new turn changes the metrics, so the old tag no longer matches
+    client.post("/analyze-turn", json={"conversation_id": "conv", "new_turn": _turn(2, "user", "Python is terrible.")})
+    third = client.get("/conversations/conv/metrics", headers={"If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["etag"] != etag
+
+
+def test_metrics_fields_projection(client):
+    """Test ?fields= keeps only the requested dotted paths."""
+    client.post("/analyze-turn", json={"conversation_id": "conv", "new_turn": _turn(1, "user", "Python is great.")})
+
+    full = client.get("/conversations/conv/metrics").json()
+
+    response = client.get(
+        "/conversations/conv/metrics",
+        params={"fields": "drift.cumulative_drift_score, commitments.total,health_score,drift.nope,missing.path"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "drift": {"cumulative_drift_score": full["drift"]["cumulative_drift_score"]},
+        "commitments": {"total": full["commitments"]["total"]},
+        "health_score": full["health_score"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_events_stream_sends_current_summary_first(store):
+    """Test the SSE stream opens with the current summary, pushes updates and ends on delete."""
+    async def subscribed():
+        while "conv" not in main.drift_subscribers:
+            await asyncio.sleep(0)
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        await http.post("/analyze-turn", json={"conversation_id": "conv", "new_turn": _turn(1, "user", "Python is great.")})
+        current = main.get_drift_summary(main.conversation_graphs["conv"])
+
+        # ASGITransport returns the body once the stream ends, so read it in a task
+        stream = asyncio.create_task(http.get("/conversations/conv/events"))
+        await asyncio.wait_for(subscribed(), timeout=5)
+
+        # Analyzed while subscribed, so it is pushed as the next event
+        await http.post("/analyze-turn", json={"conversation_id": "conv", "new_turn": _turn(2, "user", "Python is terrible.")})
+        updated = main.get_drift_summary(main.conversation_graphs["conv"])
+
+        await http.delete("/conversations/conv")
+        response = await asyncio.wait_for(stream, timeout=5)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [json.loads(chunk.removeprefix("data: ")) for chunk in response.text.split("\n\n") if chunk]
+    assert events == [current, updated]
+
+    # The subscription is dropped once the stream ends
+    assert "conv" not in main.drift_subscribers
+
+
+def test_events_queue_drops_oldest_when_full():
+    """Test a full subscriber queue keeps the newest summaries."""
+    queue = asyncio.Queue(maxsize=2)
+    for payload in ["a", "b", "c"]:
+        main._put_dropping_oldest(queue, payload)
+
+    assert [queue.get_nowait(), queue.get_nowait()] == ["b", "c"]
+
+
+def test_metrics_etag_for_unseen_conversation(client):
+    """Test a conversation not yet analyzed gets zeroed metrics with an ETag."""
+    first = client.get("/conversations/new/metrics")
+    assert first.status_code == 200
+    assert first.json()["health_score"] == 100
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+
+    second = client.get("/conversations/new/metrics", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "W/{etag}",
+    '"other", {etag}',
+    '"other" ,W/{etag}',
+    "*",
+])
+def test_metrics_if_none_match_forms(client, if_none_match):
+    """Test weak tags, tag lists and * all match."""
+    etag = client.get("/conversations/new/metrics").headers["etag"]
+
+    response = client.get(
+        "/conversations/new/metrics",
+        headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+    assert response.status_code == 304
+
+
+def test_metrics_if_none_match_mismatch(client):
+    """Test a list of other tags still gets the full body."""
+    response = client.get("/conversations/new/metrics", headers={"If-None-Match": '"a", W/"b"'})
+    assert response.status_code == 200
+    assert response.json()["health_score"] == 100
+
+
+def test_shutdown_closes_k2_client(monkeypatch):
+    """Test app shutdown closes the pooled K2 HTTP client."""
+    closed = []
+
+    async def aclose():
+        closed.append(True)
+
+    monkeypatch.setattr(analyzer.k2_client, "aclose", aclose)
+    with TestClient(main.app):
+        assert closed == []
+    assert closed == [True]
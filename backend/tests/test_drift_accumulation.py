@@ -26,6 +26,8 @@ from app.drift_accumulation import (
 )
 from app.dependency_graph import update_dependency_graph
 
+NOW = datetime(2025, 1, 1)
+
 
 def test_calculate_drift_magnitude():
     """Test drift magnitude calculation with 4-factor formula."""
@@ -34,8 +36,8 @@ def test_calculate_drift_magnitude():
     migrate_graph_to_drift_system(graph)
 
     # Add turns
-    turn1 = Turn(id=1, speaker="user", text="I think Python is great", ts=datetime.now())
-    turn2 = Turn(id=2, speaker="user", text="I think Python is terrible", ts=datetime.now())
+    turn1 = Turn(id=1, speaker="user", text="I think Python is great", ts=NOW)
+    turn2 = Turn(id=2, speaker="user", text="I think Python is terrible", ts=NOW)
     graph.turns = [turn1, turn2]
 
     # Create commitments
@@ -46,7 +48,7 @@ def test_calculate_drift_magnitude():
         normalized="Python is great",
         polarity="positive",
         confidence=0.8,
-        timestamp=datetime.now()
+        timestamp=NOW
     )
 
     new = Commitment(
@@ -56,7 +58,7 @@ def test_calculate_drift_magnitude():
         normalized="Python is terrible",
         polarity="negative",
         confidence=0.9,
-        timestamp=datetime.now()
+        timestamp=NOW
     )
 
     graph.commitments = [prior]
@@ -78,8 +80,8 @@ def test_accumulate_drift():
     migrate_graph_to_drift_system(graph)
 
     # Add turns
-    turn1 = Turn(id=1, speaker="user", text="Test 1", ts=datetime.now())
-    turn2 = Turn(id=2, speaker="user", text="Test 2", ts=datetime.now())
+    turn1 = Turn(id=1, speaker="user", text="Test 1", ts=NOW)
+    turn2 = Turn(id=2, speaker="user", text="Test 2", ts=NOW)
     graph.turns = [turn1, turn2]
 
     # Create commitments
@@ -90,7 +92,7 @@ def test_accumulate_drift():
         normalized="Initial claim",
         polarity="positive",
         confidence=0.7,
-        timestamp=datetime.now()
+        timestamp=NOW
     )
 
     new = Commitment(
@@ -100,7 +102,7 @@ def test_accumulate_drift():
         normalized="Contradictory claim",
         polarity="negative",
         confidence=0.8,
-        timestamp=datetime.now()
+        timestamp=NOW
     )
 
     graph.commitments = [prior]
@@ -134,7 +136,7 @@ def test_drift_velocity():
 
     # Add 6 turns
     for i in range(1, 7):
-        turn = Turn(id=i, speaker="user", text=f"Turn {i}", ts=datetime.now())
+        turn = Turn(id=i, speaker="user", text=f"Turn {i}", ts=NOW)
         graph.turns.append(turn)
 
     # Create commitments and drift events
@@ -146,7 +148,7 @@ def test_drift_velocity():
             normalized=f"Claim {i}",
             polarity="positive" if i % 2 == 0 else "negative",
             confidence=0.7,
-            timestamp=datetime.now()
+            timestamp=NOW
         )
         graph.commitments.append(prior)
 
@@ -163,7 +165,7 @@ def test_drift_velocity():
             dependency_depth=0,
             drift_magnitude=0.4,
             detected_at_turn=i,
-            timestamp=datetime.now()
+            timestamp=NOW
         )
         graph.drift_events.append(drift_event)
 
@@ -204,7 +206,7 @@ def test_recovery_detection():
 
     # Add turns
     for i in range(1, 11):
-        turn = Turn(id=i, speaker="user", text=f"Turn {i}", ts=datetime.now())
+        turn = Turn(id=i, speaker="user", text=f"Turn {i}", ts=NOW)
         graph.turns.append(turn)
 
     # Low drift score
@@ -222,7 +224,7 @@ def test_recovery_detection():
         dependency_depth=0,
         drift_magnitude=0.5,
         detected_at_turn=3,  # Old event, not in last 5 turns
-        timestamp=datetime.now()
+        timestamp=NOW
     )
     graph.drift_events.append(drift_event)
 
@@ -258,7 +260,7 @@ def test_gradual_accumulation():
 
     # Add 10 turns
     for i in range(1, 11):
-        turn = Turn(id=i, speaker="user", text=f"Turn {i}", ts=datetime.now())
+        turn = Turn(id=i, speaker="user", text=f"Turn {i}", ts=NOW)
         graph.turns.append(turn)
 
     # Create commitments with increasing contradiction
@@ -279,7 +281,7 @@ def test_gradual_accumulation():
             normalized=claim,
             polarity=polarity,
             confidence=confidence,
-            timestamp=datetime.now()
+            timestamp=NOW
         )
         graph.commitments.append(commitment)
 
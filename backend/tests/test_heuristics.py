@@ -12,6 +12,8 @@ from app.heuristics import (
     _infer_confidence
 )
 
+NOW = datetime(2025, 1, 1)
+
 
 def test_extract_commitments_simple():
     """Test simple commitment extraction."""
@@ -19,7 +21,7 @@ def test_extract_commitments_simple():
         id=1,
         speaker="user",
         text="I think Python is great for data science",
-        ts=datetime.now()
+        ts=NOW
     )
 
     graph = CommitmentGraph(conversation_id="test")
@@ -32,9 +34,9 @@ def test_extract_commitments_simple():
 def test_skip_trivial_messages():
     """Test that trivial messages are skipped."""
     trivial_turns = [
-        Turn(id=1, speaker="user", text="ok", ts=datetime.now()),
-        Turn(id=2, speaker="user", text="thanks", ts=datetime.now()),
-        Turn(id=3, speaker="user", text="👍", ts=datetime.now()),
+        Turn(id=1, speaker="user", text="ok", ts=NOW),
+        Turn(id=2, speaker="user", text="thanks", ts=NOW),
+        Turn(id=3, speaker="user", text="👍", ts=NOW),
     ]
 
     graph = CommitmentGraph(conversation_id="test")
@@ -46,7 +48,7 @@ def test_skip_trivial_messages():
 
 def test_detect_polarity_flip():
     """Test polarity flip detection."""
-    now = datetime.now()
+    now = NOW
 
     # Create graph with positive claim
     graph = CommitmentGraph(
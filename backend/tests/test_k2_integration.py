@@ -295,11 +295,10 @@ async def test_k2_client_timeout():
     # Create client with mock API key
     client = K2Client(api_key="test_key")
 
-    # Mock timeout - need to mock the entire async context manager
+    # Mock timeout on the pooled HTTP client the K2 client creates
     with patch('httpx.AsyncClient') as mock_client_class:
         mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
-        mock_client_class.return_value.__aexit__.return_value = None
+        mock_client_class.return_value = mock_client_instance
 
         # Make the post call timeout
         mock_post = AsyncMock()
@@ -315,6 +314,20 @@ async def test_k2_client_timeout():
         assert client.failure_count > 0
 
 
+def test_k2_client_replaces_client_from_finished_loop():
+    """Test the pooled HTTP client left on a finished loop is closed and replaced."""
+    import asyncio
+
+    client = K2Client(api_key="test_key")
+
+    first = asyncio.run(client._http_client())
+    second = asyncio.run(client._http_client())
+
+    assert second is not first
+    assert first.is_closed
+    asyncio.run(client.aclose())
+
+
 def test_k2_client_stats():
     """Test K2 client statistics tracking."""
     client = K2Client()
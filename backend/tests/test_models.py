@@ -10,6 +10,8 @@ from app.models import (
     Edge
 )
 
+NOW = datetime(2025, 1, 1)
+
 
 def test_turn_creation():
     """Test Turn model creation."""
@@ -17,7 +19,7 @@ def test_turn_creation():
         id=1,
         speaker="user",
         text="Hello world",
-        ts=datetime.now()
+        ts=NOW
     )
 
     assert turn.id == 1
@@ -34,7 +36,7 @@ def test_commitment_creation():
         normalized="Python is great",
         polarity="positive",
         confidence=0.9,
-        timestamp=datetime.now()
+        timestamp=NOW
     )
 
     assert commitment.id == "c1"
@@ -47,27 +49,31 @@ def test_commitment_graph_hash():
     graph = CommitmentGraph(
         conversation_id="test123",
         turns=[
-            Turn(id=1, speaker="user", text="Hi", ts=datetime.now())
+            Turn(id=1, speaker="user", text="Hi", ts=NOW)
         ]
     )
 
     hash1 = graph.compute_hash()
     assert isinstance(hash1, str)
-    assert len(hash1) == 64  # SHA256 hex length
+    assert len(hash1) == 64  # 256-bit hex digest
 
     # Same graph should produce same hash
     hash2 = graph.compute_hash()
     assert hash1 == hash2
 
     # Different graph should produce different hash
-    graph.turns.append(Turn(id=2, speaker="model", text="Hello", ts=datetime.now()))
+    graph.turns.append(Turn(id=2, speaker="model", text="Hello", ts=NOW))
     hash3 = graph.compute_hash()
     assert hash1 != hash3
 
+    # Incrementally updated hash matches a freshly built graph
+    fresh = CommitmentGraph(conversation_id="test123", turns=list(graph.turns))
+    assert fresh.compute_hash() == hash3
+
 
 def test_commitment_graph_get_methods():
     """Test graph lookup methods."""
-    now = datetime.now()
+    now = NOW
     commitment = Commitment(
         id="c1",
         turn_id=1,
@@ -91,6 +97,27 @@ def test_commitment_graph_get_methods():
     assert graph.get_turn(999) is None
 
 
+def test_recent_active_commitments():
+    """Test selecting the latest active commitments before a turn."""
+    graph = CommitmentGraph(conversation_id="test")
+    for i, turn_id in enumerate([1, 1, 2, 3, 3, 4], start=1):
+        graph.commitments.append(Commitment(
+            id=f"c{i}", turn_id=turn_id, kind="claim", normalized="test", timestamp=NOW
+        ))
+    graph.deactivate_commitment("c4", "c5")
+
+    # Newest turn first; ties keep list order; inactive and later turns skipped
+    recent = graph.recent_active_commitments(before_turn_id=4, limit=3)
+    assert [c.id for c in recent] == ["c5", "c3", "c1"]
+
+    # Out-of-order append falls back to a full scan with the same result
+    graph.commitments.append(Commitment(
+        id="c7", turn_id=2, kind="claim", normalized="test", timestamp=NOW
+    ))
+    recent = graph.recent_active_commitments(before_turn_id=4, limit=3)
+    assert [c.id for c in recent] == ["c5", "c3", "c7"]
+
+
 def test_alert_creation():
     """Test Alert model creation."""
     alert = Alert(
@@ -101,7 +128,7 @@ def test_alert_creation():
         related_commitments=["c1", "c2"],
         related_turns=[1, 2],
         detected_at_turn=2,
-        timestamp=datetime.now()
+        timestamp=NOW
     )
 
     assert alert.severity == "high"
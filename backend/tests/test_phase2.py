@@ -297,3 +297,22 @@ def test_count_contradictions():
 
     # Should count only "contradicts" relations
     assert graph.count_contradictions() == 2
+
+
+def test_count_contradictions_tracks_appends():
+    """Test count_contradictions stays correct as edges are appended or replaced."""
+    graph = CommitmentGraph(conversation_id="test_count_incremental")
+    assert graph.count_contradictions() == 0
+
+    graph.edges.append(Edge(source="c2", target="c1", relation="contradicts", weight=0.8))
+    assert graph.count_contradictions() == 1
+
+    graph.edges.extend([
+        Edge(source="c3", target="c1", relation="depends_on", weight=0.6),
+        Edge(source="c4", target="c3", relation="contradicts", weight=0.7),
+    ])
+    assert graph.count_contradictions() == 2
+
+    # Replacing the edge list resets the running tally
+    graph.edges = [Edge(source="c5", target="c6", relation="supports", weight=0.9)]
+    assert graph.count_contradictions() == 0